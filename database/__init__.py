@@ -1,39 +1,28 @@
-import sqlite3
-import os
 import bcrypt
 
+from database.connection import get_pool
+from database.log_sink import create_log_tables, get_log_sink
+
 class DatabaseManager:
-    def __init__(self):
-        self.db_path = 'pc_repair.db'
+    def __init__(self, db_path=None):
+        self.pool = get_pool(db_path)
+        self.db_path = self.pool.path
         self._create_tables()
         self._create_default_user()
 
     def _create_tables(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create users table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL
-        )
-        ''')
-        
-        # Create repair_logs table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS repair_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            issue_type TEXT NOT NULL,
-            description TEXT,
-            status TEXT
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        with self.pool.transaction() as conn:
+            # Create users table
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT UNIQUE NOT NULL,
+                password TEXT NOT NULL
+            )
+            ''')
+            
+            # Create the repair_logs and scan_results tables
+            create_log_tables(conn)
     
     def _create_default_user(self):
         # Create a default admin user if it doesn't exist
@@ -41,24 +30,15 @@ class DatabaseManager:
             # Hash the default password
             password = bcrypt.hashpw('admin123'.encode('utf-8'), bcrypt.gensalt())
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            INSERT INTO users (username, password) VALUES (?, ?)
+            # OR IGNORE: another process may have created it meanwhile
+            self.pool.execute('''
+            INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)
             ''', ('admin', password))
-            
-            conn.commit()
-            conn.close()
     
     def get_user(self, username):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM users WHERE username = ?', (username,))
-        user = cursor.fetchone()
-        
-        conn.close()
+        user = self.pool.fetchone(
+            'SELECT id, username, password FROM users WHERE username = ?', (username,)
+        )
         
         if user:
             return {
@@ -68,14 +48,6 @@ class DatabaseManager:
             }
         return None
     
-    def log_repair(self, issue_type, description, status):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-        INSERT INTO repair_logs (issue_type, description, status)
-        VALUES (?, ?, ?)
-        ''', (issue_type, description, status))
-        
-        conn.commit()
-        conn.close()
\ No newline at end of file
+    def log_repair(self, issue_type, description, status, severity=None):
+        # Queued and written in batches by the shared log sink
+        get_log_sink(self.db_path).log_repair(issue_type, description, status, severity)
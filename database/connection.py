@@ -0,0 +1,109 @@
+import contextlib
+import os
+import sqlite3
+import threading
+
+from modules.app_paths import data_dir
+
+DB_NAME = 'pc_repair.db'
+
+def default_db_path():
+    """The database shared by every part of the app"""
+    return os.path.join(data_dir(), DB_NAME)
+
+class ConnectionPool:
+    """Reusable SQLite connections to one database file
+
+    Each thread gets its own long-lived connection (sqlite3 connections must
+    not be shared between threads), so repeated queries reuse the
+    connection's prepared statement cache instead of reconnecting. The
+    database runs in WAL mode, so readers never block the writer and other
+    processes (e.g. a background agent) can use the same file; busy_timeout
+    makes writers wait for the lock rather than fail. Connections are opened
+    in autocommit mode: single statements commit immediately and
+    transaction() groups several.
+    """
+    def __init__(self, path, busy_timeout=5000, cached_statements=256):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def connection(self):
+        """Return the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        # A connection inherited across fork() must not be used by the child
+        if conn is None or self._local.pid != os.getpid():
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout / 1000,
+            isolation_level=None,
+            cached_statements=self.cached_statements,
+            # Only its own thread uses a connection; this lets close_all()
+            # close them from whichever thread shuts the app down
+            check_same_thread=False
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout)}')
+        conn.execute('PRAGMA foreign_keys=ON')
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Run several statements atomically, rolling back on error
+
+        BEGIN IMMEDIATE takes the write lock up front, so a transaction never
+        fails halfway on a lock held by another writer.
+        """
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def execute(self, sql, params=()):
+        return self.connection().execute(sql, params)
+
+    def executemany(self, sql, rows):
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows)
+
+    def fetchone(self, sql, params=()):
+        return self.execute(sql, params).fetchone()
+
+    def fetchall(self, sql, params=()):
+        return self.execute(sql, params).fetchall()
+
+    def close_all(self):
+        """Close every connection opened by this pool"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(path=None):
+    """Return the shared ConnectionPool for a database file"""
+    path = os.path.abspath(path or default_db_path())
+    with _pools_lock:
+        if path not in _pools:
+            _pools[path] = ConnectionPool(path)
+        return _pools[path]
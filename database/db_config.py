@@ -1,83 +1,55 @@
-import sqlite3
-import os
 import bcrypt
-import time
+
+from database.connection import get_pool
+from database.log_sink import create_log_tables, get_log_sink
 
 class DatabaseManager:
-    def __init__(self):
-        self.db_name = f'pc_repair_{int(time.time())}.db'  # Unique database name
+    def __init__(self, db_path=None):
+        self.pool = get_pool(db_path)
+        self.db_name = self.pool.path
         self._create_tables()
         self._create_default_user()
 
     def _create_tables(self):
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            # Users table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    password TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Repair logs table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS repair_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    issue_type TEXT NOT NULL,
-                    description TEXT,
-                    status TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.commit()
-            conn.close()
+            with self.pool.transaction() as conn:
+                # Users table
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS users (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        username TEXT UNIQUE NOT NULL,
+                        password TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                # Repair logs and scan results tables
+                create_log_tables(conn)
         except Exception as e:
             print(f"Error creating tables: {e}")
-            if os.path.exists(self.db_name):
-                os.remove(self.db_name)
             raise
-    
+
     def _create_default_user(self):
         try:
             if not self.get_user('admin'):
-                conn = sqlite3.connect(self.db_name)
-                cursor = conn.cursor()
-                
                 # Create default admin user with password 'admin123'
                 password = bcrypt.hashpw('admin123'.encode('utf-8'), bcrypt.gensalt())
-                cursor.execute(
-                    "INSERT INTO users (username, password) VALUES (?, ?)",
+                # OR IGNORE: another process may have created it meanwhile
+                self.pool.execute(
+                    "INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)",
                     ('admin', password)
                 )
-                
-                conn.commit()
-                conn.close()
         except Exception as e:
             print(f"Error creating default user: {e}")
-            if os.path.exists(self.db_name):
-                os.remove(self.db_name)
             raise
-    
+
     def get_user(self, username):
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            user = self.pool.fetchone(
                 "SELECT id, username, password FROM users WHERE username = ?",
                 (username,)
             )
-            user = cursor.fetchone()
-            
-            conn.close()
-            
+
             if user:
                 return {
                     'id': user[0],
@@ -88,20 +60,7 @@ class DatabaseManager:
         except Exception as e:
             print(f"Error getting user: {e}")
             return None
-    
-    def log_repair(self, issue_type, description, status):
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "INSERT INTO repair_logs (issue_type, description, status) VALUES (?, ?, ?)",
-                (issue_type, description, status)
-            )
-            
-            conn.commit()
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"Error logging repair: {e}")
-            return False
\ No newline at end of file
+
+    def log_repair(self, issue_type, description, status, severity=None):
+        # Queued and written in batches by the shared log sink
+        return get_log_sink(self.db_name).log_repair(issue_type, description, status, severity)
@@ -0,0 +1,118 @@
+from datetime import timezone
+
+from database.connection import get_pool
+from database.log_sink import FILTER_COLUMNS, create_log_tables
+
+# History kinds and the log table holding them
+LOGS = {
+    'repair': 'repair_logs',
+    'scan': 'scan_results',
+}
+
+COLUMNS = {
+    'repair_logs': ('id', 'timestamp', 'issue_type', 'description', 'status', 'severity'),
+    'scan_results': ('id', 'timestamp', 'issue_type', 'severity', 'description', 'details'),
+}
+
+def _db_time(value):
+    """Timestamps are stored as UTC 'YYYY-MM-DD HH:MM:SS' text"""
+    if value is None or isinstance(value, str):
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+def format_cursor(cursor):
+    return f'{cursor[0]}|{cursor[1]}' if cursor else None
+
+def parse_cursor(text):
+    """Turn format_cursor() output (e.g. from the CLI) back into a cursor"""
+    if not text:
+        return None
+    timestamp, _, row_id = text.rpartition('|')
+    return timestamp, int(row_id)
+
+class LogHistory:
+    """Read API over the repair and scan logs
+
+    page() filters by time range, issue type, status and severity, newest
+    first, and paginates by keyset: the cursor is the (timestamp, id) of the
+    last row returned, so fetching any page is an index range scan no matter
+    how deep it is. daily_counts() reads the trigger-maintained
+    log_daily_counts table instead of the logs themselves.
+    """
+    def __init__(self, pool=None):
+        self.pool = pool or get_pool()
+        self._tables_ready = False
+
+    def _table(self, kind):
+        if kind not in LOGS:
+            raise ValueError(f'Unknown history kind: {kind}')
+        if not self._tables_ready:
+            with self.pool.transaction() as conn:
+                create_log_tables(conn)
+            self._tables_ready = True
+        return LOGS[kind]
+
+    def page(self, kind='repair', start=None, end=None, issue_type=None, status=None,
+             severity=None, limit=50, after=None):
+        """Return (rows, next_cursor); next_cursor is None on the last page"""
+        table = self._table(kind)
+        filters = {'issue_type': issue_type, 'status': status, 'severity': severity}
+        where = []
+        params = []
+        for column, value in filters.items():
+            if value is None:
+                continue
+            if column not in FILTER_COLUMNS[table]:
+                raise ValueError(f'{kind} history has no {column}')
+            where.append(f'{column} = ?')
+            params.append(value)
+        if start is not None:
+            where.append('timestamp >= ?')
+            params.append(_db_time(start))
+        if end is not None:
+            where.append('timestamp < ?')
+            params.append(_db_time(end))
+        if after is not None:
+            where.append('(timestamp, id) < (?, ?)')
+            params.extend(after)
+
+        columns = COLUMNS[table]
+        # The ids of the page come from a covering index; only those rows are read
+        sql = (f'SELECT {", ".join(columns)} FROM {table} WHERE id IN ('
+               f'SELECT id FROM {table}'
+               f'{" WHERE " + " AND ".join(where) if where else ""}'
+               f' ORDER BY timestamp DESC, id DESC LIMIT ?)'
+               f' ORDER BY timestamp DESC, id DESC')
+        # One extra row tells whether another page follows
+        rows = [dict(zip(columns, row)) for row in self.pool.fetchall(sql, params + [limit + 1])]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]['timestamp'], rows[-1]['id'])
+        return rows, next_cursor
+
+    def daily_counts(self, kind='repair', start=None, end=None, issue_type=None):
+        """Counts per day and issue type: [{'day', 'issue_type', 'count'}], newest day first"""
+        table = self._table(kind)
+        where = ['log = ?', 'count > 0']
+        params = [table]
+        if start is not None:
+            where.append('day >= date(?)')
+            params.append(_db_time(start))
+        if end is not None:
+            where.append('day <= date(?)')
+            params.append(_db_time(end))
+        if issue_type is not None:
+            where.append('issue_type = ?')
+            params.append(issue_type)
+
+        rows = self.pool.fetchall(
+            f'SELECT day, issue_type, SUM(count) FROM log_daily_counts WHERE {" AND ".join(where)} '
+            f'GROUP BY day, issue_type ORDER BY day DESC, issue_type',
+            params
+        )
+        return [{'day': day, 'issue_type': issue, 'count': count} for day, issue, count in rows]
+
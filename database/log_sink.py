@@ -0,0 +1,308 @@
+import atexit
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from database.connection import get_pool
+from modules.app_paths import log_dir
+from modules.jsonl_log import RotatingJsonlLog
+
+LOG_TABLES = {
+    'repair_logs': ('timestamp', 'issue_type', 'description', 'status', 'severity'),
+    'scan_results': ('timestamp', 'issue_type', 'severity', 'description', 'details'),
+}
+
+# Columns the history API filters on, per log table
+FILTER_COLUMNS = {
+    'repair_logs': ('issue_type', 'status', 'severity'),
+    'scan_results': ('issue_type', 'severity'),
+}
+
+def create_log_tables(conn):
+    """Create (or upgrade) the repair_logs and scan_results tables and their indexes"""
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS repair_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        issue_type TEXT NOT NULL,
+        description TEXT,
+        status TEXT,
+        severity TEXT
+    )
+    ''')
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(repair_logs)')}
+    if 'severity' not in columns:
+        conn.execute('ALTER TABLE repair_logs ADD COLUMN severity TEXT')
+
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS scan_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        issue_type TEXT NOT NULL,
+        severity TEXT,
+        description TEXT,
+        details TEXT
+    )
+    ''')
+
+    # One index per filter column (and one for no filter), ordered for keyset
+    # pagination on (timestamp, id) and carrying the other filter columns, so
+    # LogHistory.page() finds a page's ids from the index alone, whatever
+    # combination of filters is given. Only the rows of the page are read.
+    for table, columns in FILTER_COLUMNS.items():
+        # Replace the indexes that held just (column, timestamp)
+        conn.execute(f'DROP INDEX IF EXISTS idx_{table}_timestamp')
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_by_timestamp '
+                     f'ON {table} (timestamp, id, {", ".join(columns)})')
+        for column in columns:
+            others = [other for other in columns if other != column]
+            conn.execute(f'DROP INDEX IF EXISTS idx_{table}_{column}')
+            conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_by_{column} '
+                         f'ON {table} ({column}, timestamp, id, {", ".join(others)})')
+    _create_daily_counts(conn)
+
+def _create_daily_counts(conn):
+    """Per-day counts kept up to date by triggers, so aggregates never scan the logs"""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'log_daily_counts'"
+    ).fetchone()
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS log_daily_counts (
+        log TEXT NOT NULL,
+        day TEXT NOT NULL,
+        issue_type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (log, day, issue_type, status, severity)
+    ) WITHOUT ROWID
+    ''')
+
+    for table in FILTER_COLUMNS:
+        status = "IFNULL(NEW.status, '')" if table == 'repair_logs' else "''"
+        old_status = "IFNULL(OLD.status, '')" if table == 'repair_logs' else "''"
+        conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_daily_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO log_daily_counts (log, day, issue_type, status, severity, count)
+            VALUES ('{table}', date(NEW.timestamp), NEW.issue_type, {status},
+                    IFNULL(NEW.severity, ''), 1)
+            ON CONFLICT (log, day, issue_type, status, severity) DO UPDATE SET count = count + 1;
+        END
+        ''')
+        conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_daily_delete AFTER DELETE ON {table}
+        BEGIN
+            UPDATE log_daily_counts SET count = count - 1
+            WHERE log = '{table}' AND day = date(OLD.timestamp) AND issue_type = OLD.issue_type
+              AND status = {old_status} AND severity = IFNULL(OLD.severity, '');
+        END
+        ''')
+
+        if not exists:
+            # Backfill from rows logged before the table existed
+            conn.execute(f'''
+            INSERT INTO log_daily_counts (log, day, issue_type, status, severity, count)
+            SELECT '{table}', date(timestamp), issue_type, {status.replace('NEW.', '')},
+                   IFNULL(severity, ''), COUNT(*)
+            FROM {table} GROUP BY 2, 3, 4, 5
+            ''')
+
+def _timestamp():
+    # Same format and clock (UTC) as SQLite's CURRENT_TIMESTAMP
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+class LogSink:
+    """Asynchronous, batched writer for repair and scan events
+
+    log_repair() and log_scan_result() only enqueue; a writer thread inserts
+    the queued rows with executemany() in one transaction once batch_size
+    rows are waiting or flush_interval seconds have passed, and appends the
+    same events to a rotating JSONL log. When the queue is full, producers
+    wait up to put_timeout seconds and the event is then dropped; metrics()
+    reports how often that happens. Everything still queued is written by
+    flush() and close(), which also runs at exit.
+    """
+    def __init__(self, pool=None, jsonl=None, batch_size=500, flush_interval=1.0,
+                 max_queue=10000, put_timeout=0.5):
+        self.pool = pool
+        self.jsonl = jsonl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._metrics = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'blocked': 0,
+            'errors': 0,
+            'batches': 0,
+            'last_batch_size': 0,
+            'last_flush_seconds': 0.0,
+            'high_water': 0,
+        }
+        self._tables_ready = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='log-sink', daemon=True)
+        self._thread.start()
+
+    def log_repair(self, issue_type, description, status, severity=None):
+        return self._put('repair_logs', {
+            'timestamp': _timestamp(),
+            'issue_type': issue_type,
+            'description': description,
+            'status': status,
+            'severity': severity
+        })
+
+    def log_scan_result(self, issue):
+        """Queue one scan finding (an issue dict from SystemScanner)"""
+        details = {key: value for key, value in issue.items()
+                   if key not in ('type', 'severity', 'description')}
+        return self._put('scan_results', {
+            'timestamp': _timestamp(),
+            'issue_type': issue.get('type', 'unknown'),
+            'severity': issue.get('severity'),
+            'description': issue.get('description'),
+            'details': json.dumps(details, default=str) if details else None
+        })
+
+    def _put(self, table, row):
+        if self._closed:
+            return False
+        item = (table, row)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self._count('blocked')
+            try:
+                self.queue.put(item, timeout=self.put_timeout)
+            except queue.Full:
+                self._count('dropped')
+                return False
+        with self._lock:
+            self._metrics['enqueued'] += 1
+            self._metrics['high_water'] = max(self._metrics['high_water'], self.queue.qsize())
+        return True
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._metrics[key] += amount
+
+    def metrics(self):
+        """Queue depth and throughput counters, for monitoring backpressure"""
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics['queued'] = self.queue.qsize()
+        metrics['max_queue'] = self.queue.maxsize
+        return metrics
+
+    def flush(self, timeout=None):
+        """Write everything queued so far; returns False on timeout"""
+        done = threading.Event()
+        # The marker may wait for room like any event, but is never dropped
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=10):
+        """Flush and stop the writer thread"""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self.queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        batch = []
+        waiters = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = False
+
+            stop = item is None
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item:
+                batch.append(item)
+
+            if stop or waiters or len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                if batch:
+                    self._write(batch)
+                    batch = []
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+                deadline = time.monotonic() + self.flush_interval
+            if stop:
+                return
+
+    def _write(self, batch):
+        started = time.monotonic()
+        stored = not self.pool
+        rows = {}
+        for table, row in batch:
+            rows.setdefault(table, []).append(row)
+
+        if self.pool:
+            try:
+                with self.pool.transaction() as conn:
+                    if not self._tables_ready:
+                        create_log_tables(conn)
+                    for table, table_rows in rows.items():
+                        columns = LOG_TABLES[table]
+                        conn.executemany(
+                            f'INSERT INTO {table} ({", ".join(columns)}) '
+                            f'VALUES ({", ".join("?" for _ in columns)})',
+                            [tuple(row[column] for column in columns) for row in table_rows]
+                        )
+                self._tables_ready = True
+                stored = True
+            except Exception:
+                # The batch is lost for the database but still goes to the JSONL log
+                self._count('errors')
+        if self.jsonl:
+            try:
+                self.jsonl.write_many([dict(row, table=table) for table, row in batch])
+            except Exception:
+                self._count('errors')
+
+        with self._lock:
+            if stored:
+                self._metrics['written'] += len(batch)
+            self._metrics['batches'] += 1
+            self._metrics['last_batch_size'] = len(batch)
+            self._metrics['last_flush_seconds'] = time.monotonic() - started
+
+
+_sinks = {}
+_sinks_lock = threading.Lock()
+
+def get_log_sink(db_path=None):
+    """Return the shared LogSink for a database, flushed and closed at exit
+
+    When the database or log directory cannot be used the sink still
+    accepts events and writes whatever it can.
+    """
+    with _sinks_lock:
+        try:
+            pool = get_pool(db_path)
+        except OSError:
+            pool = None
+        key = pool.path if pool else None
+        if key not in _sinks:
+            try:
+                jsonl = RotatingJsonlLog(log_dir())
+            except OSError:
+                jsonl = None
+            sink = LogSink(pool, jsonl)
+            atexit.register(sink.close)
+            _sinks[key] = sink
+        return _sinks[key]
@@ -0,0 +1,157 @@
+import threading
+import time
+
+from database.connection import get_pool
+
+# Table, bucket width in seconds and how long rows are kept, finest first
+RESOLUTIONS = {
+    'raw': ('metrics_raw', 1, 6 * 3600),
+    '1m': ('metrics_1m', 60, 7 * 86400),
+    '1h': ('metrics_1h', 3600, 365 * 86400),
+}
+
+PRUNE_INTERVAL = 300
+
+def create_metrics_tables(conn):
+    """Create the raw and rollup metric tables
+
+    Rows are keyed by (metric, ts) so a range query for one metric is a
+    single index range scan; the separate ts index serves retention pruning.
+    """
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS metrics_raw (
+        metric TEXT NOT NULL,
+        ts INTEGER NOT NULL,
+        value REAL NOT NULL,
+        PRIMARY KEY (metric, ts)
+    ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_metrics_raw_ts ON metrics_raw (ts)')
+    for table in ('metrics_1m', 'metrics_1h'):
+        conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS {table} (
+            metric TEXT NOT NULL,
+            ts INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            sum REAL NOT NULL,
+            min REAL NOT NULL,
+            max REAL NOT NULL,
+            PRIMARY KEY (metric, ts)
+        ) WITHOUT ROWID
+        ''')
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table} (ts)')
+
+class MetricsStore:
+    """Durable time series of system metrics with automatic rollups
+
+    record() stores raw samples and folds them into 1-minute and 1-hour
+    buckets in the same transaction (an upsert per bucket), so no separate
+    rollup job is needed. A second sample for a metric within the same
+    second is ignored everywhere, so raw rows and rollups stay consistent. Each resolution is pruned to its retention
+    window, bounding the database size. query() answers from the finest
+    resolution that still covers the requested range.
+    """
+    def __init__(self, pool=None):
+        self.pool = pool or get_pool()
+        self._tables_ready = False
+        self._last_prune = 0
+
+    def _ensure_tables(self):
+        if not self._tables_ready:
+            with self.pool.transaction() as conn:
+                create_metrics_tables(conn)
+            self._tables_ready = True
+
+    def record(self, samples, timestamp=None):
+        """Store {metric: value} samples taken at timestamp (default: now)"""
+        ts = int(timestamp if timestamp is not None else time.time())
+        rows = [(metric, ts, float(value)) for metric, value in samples.items() if value is not None]
+        if not rows:
+            return
+        self._ensure_tables()
+        with self.pool.transaction() as conn:
+            # Only samples that made it into raw are folded into the rollups
+            rows = [row for row in rows if conn.execute(
+                'INSERT OR IGNORE INTO metrics_raw (metric, ts, value) VALUES (?, ?, ?)', row
+            ).rowcount]
+            if not rows:
+                return
+            for resolution in ('1m', '1h'):
+                table, width, _ = RESOLUTIONS[resolution]
+                conn.executemany(f'''
+                    INSERT INTO {table} (metric, ts, count, sum, min, max) VALUES (?, ?, 1, ?, ?, ?)
+                    ON CONFLICT (metric, ts) DO UPDATE SET
+                        count = count + 1,
+                        sum = sum + excluded.sum,
+                        min = MIN(min, excluded.min),
+                        max = MAX(max, excluded.max)
+                ''', [(metric, ts - ts % width, value, value, value) for metric, ts, value in rows])
+
+        if ts - self._last_prune >= PRUNE_INTERVAL:
+            self.prune(ts)
+
+    def prune(self, now=None):
+        """Drop rows older than each resolution's retention window"""
+        now = int(now if now is not None else time.time())
+        self._last_prune = now
+        self._ensure_tables()
+        with self.pool.transaction() as conn:
+            for table, _, retention in RESOLUTIONS.values():
+                conn.execute(f'DELETE FROM {table} WHERE ts < ?', (now - retention,))
+
+    def resolution_for(self, start, now=None):
+        """Finest resolution whose retention still reaches back to start"""
+        now = now if now is not None else time.time()
+        for resolution, (_, _, retention) in RESOLUTIONS.items():
+            if start >= now - retention:
+                return resolution
+        return '1h'
+
+    def query(self, metric, start, end=None, resolution=None):
+        """Return [(ts, avg, min, max)] for metric between start and end (Unix seconds)"""
+        end = end if end is not None else time.time()
+        resolution = resolution or self.resolution_for(start)
+        table = RESOLUTIONS[resolution][0]
+        self._ensure_tables()
+        if resolution == 'raw':
+            sql = f'SELECT ts, value, value, value FROM {table} WHERE metric = ? AND ts BETWEEN ? AND ? ORDER BY ts'
+        else:
+            sql = f'SELECT ts, sum / count, min, max FROM {table} WHERE metric = ? AND ts BETWEEN ? AND ? ORDER BY ts'
+        return self.pool.fetchall(sql, (metric, int(start), int(end)))
+
+    def summary(self, metric, start, end=None):
+        """Average, minimum and maximum of metric over a time range"""
+        end = end if end is not None else time.time()
+        resolution = self.resolution_for(start)
+        # Raw rows carry one sample each; rollups carry their own counts
+        if resolution == 'raw':
+            columns = 'COUNT(*), SUM(value), MIN(value), MAX(value)'
+        else:
+            columns = 'SUM(count), SUM(sum), MIN(min), MAX(max)'
+        self._ensure_tables()
+        count, total, low, high = self.pool.fetchone(
+            f'SELECT {columns} FROM {RESOLUTIONS[resolution][0]} WHERE metric = ? AND ts BETWEEN ? AND ?',
+            (metric, int(start), int(end))
+        )
+        if not count:
+            return None
+        return {'samples': count, 'avg': round(total / count, 1), 'min': low, 'max': high}
+
+    def metrics(self):
+        """Names of all metrics with retained raw or rolled-up samples"""
+        self._ensure_tables()
+        return [row[0] for row in self.pool.fetchall(
+            'SELECT DISTINCT metric FROM metrics_1h ORDER BY metric'
+        )]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_metrics_store():
+    """Return the shared MetricsStore on the app database"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MetricsStore()
+        return _store
@@ -0,0 +1,301 @@
+from array import array
+
+from PyQt6.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt6.QtGui import QColor, QPainter, QPalette, QPen, QPolygonF, QTransform
+from PyQt6.QtWidgets import QWidget
+
+from modules.ring_buffer import RingBuffer
+
+# Trace colours, cycled through for charts with several channels
+PALETTE = ("#2196F3", "#E53935", "#4CAF50", "#FB8C00", "#8E24AA", "#00ACC1")
+
+def format_rate(value):
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB/s"
+
+def format_percent(value):
+    return f"{value:.0f}%"
+
+def _doubles(view):
+    values = array('d')
+    values.frombytes(view.cast('B'))
+    return values
+
+def _polygon(coords):
+    """QPolygonF from a flat x0, y0, x1, y1, ... array, copied in one go"""
+    polygon = QPolygonF()
+    polygon.resize(len(coords) // 2)
+    pointer = polygon.data()
+    pointer.setsize(len(coords) * coords.itemsize)
+    memoryview(pointer)[:] = memoryview(coords).cast('B')
+    return polygon
+
+class Envelope:
+    """Min/max of every `bucket` consecutive samples of one buffer channel
+
+    Buckets are aligned to the buffer's absolute sample count, so a bucket
+    never changes once it is full. update() only reduces the buckets
+    completed since the previous call and keeps them in a RingBuffer of
+    their own, with the bucket number as timestamp.
+    """
+    def __init__(self, buffer, channel, bucket):
+        self.buffer = buffer
+        self.channel = channel
+        self.bucket = bucket
+        self.buckets = RingBuffer(-(-buffer.capacity // bucket) + 1, channels=2)
+        self.next = None  # Number of the next bucket to complete
+
+    def update(self):
+        buffer = self.buffer
+        bucket = self.bucket
+        total = buffer.total
+        oldest = total - len(buffer)
+        # Start over after clear(), or when unseen samples were overwritten
+        if self.next is None or self.next * bucket < oldest or self.next * bucket > total:
+            self.buckets.clear()
+            self.next = -(-oldest // bucket)
+        values = buffer.window(self.channel)
+        while (self.next + 1) * bucket <= total:
+            start = self.next * bucket - oldest
+            chunk = values[start:start + bucket]
+            self.buckets.append(self.next, (min(chunk), max(chunk)))
+            self.next += 1
+
+    def coords(self, first):
+        """x, max, x, min per bucket from bucket `first` on, in bucket units
+
+        The newest, still filling bucket is included.
+        """
+        count = max(min(len(self.buckets), self.next - first), 0)
+        numbers = _doubles(self.buckets.time_window(count))
+        coords = array('d', bytes(32 * count))
+        coords[0::4] = numbers
+        coords[1::4] = _doubles(self.buckets.window(1, count))
+        coords[2::4] = numbers
+        coords[3::4] = _doubles(self.buckets.window(0, count))
+
+        partial = self.buffer.total - self.next * self.bucket
+        if partial > 0:
+            chunk = self.buffer.window(self.channel, partial)
+            coords.extend((self.next, max(chunk), self.next, min(chunk)))
+        return coords
+
+class TimeSeriesChart(QWidget):
+    """Draws channels of a RingBuffer as traces with QPainter
+
+    At most the newest `span` samples are shown, right-aligned. When there
+    are more samples than pixel columns, every column is reduced to the min
+    and max of its samples (an Envelope) and drawn as one vertical stroke,
+    so spikes survive and the paint cost depends on the widget width, not
+    the history length. Coordinates stay in sample units and are copied
+    into the polygon in bulk; the painter transform maps them to pixels.
+    """
+    def __init__(self, buffer, channels=None, span=None, value_range=None, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.channels = list(range(buffer.channels)) if channels is None else list(channels)
+        self.span = span or buffer.capacity
+        # (low, high) for a fixed scale, or None to scale to the visible data
+        self.value_range = value_range
+        self.colors = {channel: QColor(PALETTE[i % len(PALETTE)])
+                       for i, channel in enumerate(self.channels)}
+        self._envelopes = {}
+        # Charts fill their own background, so a repaint never has to
+        # repaint the (stylesheet-styled) parents behind them first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def begin_paint(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().color(QPalette.ColorRole.Window))
+        return painter
+
+    def set_span(self, span):
+        self.span = min(span, self.buffer.capacity)
+        self.update()
+
+    def plot_rect(self):
+        return QRectF(self.rect()).adjusted(1, 1, -1, -1)
+
+    def _traces(self, columns, channels):
+        """Per channel (channel, coords, bucket); bucket is 1 for raw samples
+
+        With raw samples the coords are (sample number, value) pairs, with
+        buckets they come from Envelope.coords().
+        """
+        buffer = self.buffer
+        count = min(self.span, len(buffer))
+        if count <= 2 * columns:
+            first = buffer.total - count
+            numbers = array('d', range(first, buffer.total))
+            traces = []
+            for channel in channels:
+                coords = array('d', bytes(16 * count))
+                coords[0::2] = numbers
+                coords[1::2] = _doubles(buffer.window(channel, count))
+                traces.append((channel, coords, 1))
+            return traces
+
+        bucket = -(-self.span // columns)
+        first = (buffer.total - count) // bucket
+        traces = []
+        for channel in channels:
+            envelope = self._envelopes.get(channel)
+            if envelope is None or envelope.bucket != bucket:
+                envelope = self._envelopes[channel] = Envelope(buffer, channel, bucket)
+            envelope.update()
+            traces.append((channel, envelope.coords(first), bucket))
+        return traces
+
+    def _range(self, traces):
+        if self.value_range:
+            return self.value_range
+        high = 0.0
+        for channel, coords, bucket in traces:
+            if coords:
+                high = max(high, max(coords[1::2]))
+        return 0.0, high * 1.1 or 1.0
+
+    def paint_traces(self, painter, rect, channels=None):
+        """Draw the channels (all by default) inside `rect`
+
+        Returns the (low, high) scale used.
+        """
+        channels = self.channels if channels is None else channels
+        traces = self._traces(max(int(rect.width()), 1), channels)
+        low, high = self._range(traces)
+        scale = rect.height() / ((high - low) or 1.0)
+        step = rect.width() / max(self.span - 1, 1)
+        newest = self.buffer.total - 1
+
+        painter.save()
+        painter.setClipRect(rect)
+        base = painter.transform()
+        for channel, coords, bucket in traces:
+            if not coords:
+                continue
+            # Bucket n is drawn at the middle of its samples
+            center = (bucket - 1) / 2
+            painter.setTransform(QTransform(
+                bucket * step, 0, 0, -scale,
+                rect.right() - (newest - center) * step, rect.bottom() + low * scale
+            ) * base)
+            # Raw samples are antialiased; one stroke per pixel column is crisp without
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, bucket == 1)
+            # Cosmetic 1px pens ignore the transform and skip Qt's slow stroker
+            pen = QPen(self.colors[channel], 1)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawPolyline(_polygon(coords))
+        painter.restore()
+        return low, high
+
+    def paintEvent(self, event):
+        painter = self.begin_paint(event)
+        self.paint_traces(painter, self.plot_rect())
+        painter.end()
+
+class SparklineGrid(TimeSeriesChart):
+    """Small, axis-less charts of every channel, laid out in a grid
+
+    All cells are painted by this one widget, so 64 cores cost one repaint
+    rather than 64 widgets' worth of paint events and labels.
+    """
+    CELL_HEIGHT = 52
+    LABEL_HEIGHT = 16
+    SPACING = 8
+
+    def __init__(self, buffer, labels, columns=8, span=None, value_range=(0, 100), parent=None):
+        super().__init__(buffer, None, span, value_range, parent)
+        self.labels = list(labels)
+        self.columns = columns
+        color = QColor(PALETTE[0])
+        self.colors = {channel: color for channel in self.channels}
+        rows = -(-len(self.channels) // columns)
+        self.setMinimumSize(columns * 60, rows * (self.CELL_HEIGHT + self.SPACING))
+
+    def sizeHint(self):
+        return QSize(self.columns * 140, self.minimumHeight())
+
+    def paintEvent(self, event):
+        painter = self.begin_paint(event)
+        text_color = self.palette().color(QPalette.ColorRole.WindowText)
+        frame_pen = QPen(self.palette().color(QPalette.ColorRole.Mid), 1)
+        width = (self.width() - self.SPACING * (self.columns - 1)) / self.columns
+        exposed = QRectF(event.rect())
+
+        for i, (channel, label) in enumerate(zip(self.channels, self.labels)):
+            cell = QRectF((width + self.SPACING) * (i % self.columns),
+                          (self.CELL_HEIGHT + self.SPACING) * (i // self.columns),
+                          width, self.CELL_HEIGHT)
+            if not cell.intersects(exposed):
+                continue
+            latest = self.buffer.latest(channel)
+            painter.setPen(text_color)
+            painter.drawText(QPointF(cell.left() + 2, cell.top() + self.LABEL_HEIGHT - 4),
+                             f"{label} {format_percent(latest) if latest is not None else '-'}")
+            chart = cell.adjusted(0, self.LABEL_HEIGHT, -1, -1)
+            painter.setPen(frame_pen)
+            painter.drawRect(chart)
+            self.paint_traces(painter, chart.adjusted(2, 2, -2, -2), [channel])
+        painter.end()
+
+class LineChart(TimeSeriesChart):
+    """Chart with a title, horizontal grid, scale label and a legend
+
+    The legend shows the newest value of every channel, formatted with
+    `formatter`.
+    """
+    GRID_LINES = 4
+
+    def __init__(self, buffer, title, labels, channels=None, span=None, value_range=None,
+                 formatter=format_percent, parent=None):
+        super().__init__(buffer, channels, span, value_range, parent)
+        self.title = title
+        self.labels = list(labels)
+        self.formatter = formatter
+        self.setMinimumSize(260, 160)
+
+    def sizeHint(self):
+        return QSize(420, 200)
+
+    def paintEvent(self, event):
+        painter = self.begin_paint(event)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        text_color = self.palette().color(QPalette.ColorRole.WindowText)
+        grid_color = self.palette().color(QPalette.ColorRole.Mid)
+        metrics = painter.fontMetrics()
+        line = metrics.height()
+
+        # Title and legend above the plot
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(text_color)
+        painter.drawText(QPointF(4, line), self.title)
+        font.setBold(False)
+        painter.setFont(font)
+
+        x = 4 + metrics.horizontalAdvance(self.title) + 20
+        for channel, label in zip(self.channels, self.labels):
+            color = self.colors[channel]
+            latest = self.buffer.latest(channel)
+            text = f"{label} {self.formatter(latest) if latest is not None else '-'}"
+            painter.fillRect(QRectF(x, line - 9, 10, 10), color)
+            painter.setPen(text_color)
+            painter.drawText(QPointF(x + 14, line), text)
+            x += 14 + metrics.horizontalAdvance(text) + 16
+
+        rect = QRectF(self.rect()).adjusted(4, line + 8, -4, -4)
+        painter.setPen(QPen(grid_color, 1, Qt.PenStyle.DotLine))
+        for i in range(self.GRID_LINES + 1):
+            y = rect.top() + rect.height() * i / self.GRID_LINES
+            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+
+        low, high = self.paint_traces(painter, rect)
+
+        painter.setPen(text_color)
+        painter.drawText(QPointF(rect.left() + 2, rect.top() + line), self.formatter(high))
+        painter.end()
@@ -0,0 +1,114 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView
+)
+
+from database.history import LogHistory
+
+ALL = "All"
+
+class HistoryDialog(QDialog):
+    """Browse the repair and scan logs page by page
+
+    Filters map directly onto LogHistory.page(); "Load More" continues from
+    the keyset cursor of the last page, so browsing stays fast however many
+    rows the logs hold.
+    """
+    PAGE_SIZE = 100
+    FILTERS = {
+        'issue_type': ("Type", [ALL, 'cpu', 'memory', 'disk', 'network', 'system',
+                                'purge', 'clean_caches', 'flush_dns', 'repair_permissions']),
+        'status': ("Status", [ALL, 'success', 'failed']),
+        'severity': ("Severity", [ALL, 'low', 'medium', 'high', 'critical']),
+    }
+
+    def __init__(self, history=None, parent=None):
+        super().__init__(parent)
+        self.history = history or LogHistory()
+        self.cursor = None
+        self.setWindowTitle("History")
+        self.resize(900, 600)
+        self.setup_ui()
+        self.reload()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        filter_layout = QHBoxLayout()
+        self.kind_combo = QComboBox()
+        self.kind_combo.addItem("Repairs", 'repair')
+        self.kind_combo.addItem("Scan findings", 'scan')
+        self.kind_combo.currentIndexChanged.connect(self.reload)
+        filter_layout.addWidget(self.kind_combo)
+
+        self.filter_combos = {}
+        for key, (label, values) in self.FILTERS.items():
+            filter_layout.addWidget(QLabel(label))
+            combo = QComboBox()
+            combo.addItems(values)
+            combo.currentIndexChanged.connect(self.reload)
+            filter_layout.addWidget(combo)
+            self.filter_combos[key] = combo
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Time (UTC)", "Type", "Status", "Description"])
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.daily_label = QLabel()
+        self.daily_label.setWordWrap(True)
+        layout.addWidget(self.daily_label)
+
+        self.more_button = QPushButton("Load More")
+        self.more_button.clicked.connect(self.load_page)
+        layout.addWidget(self.more_button)
+
+        self.setLayout(layout)
+
+    def _filters(self):
+        kind = self.kind_combo.currentData()
+        # Scan findings have no status
+        self.filter_combos['status'].setEnabled(kind == 'repair')
+        filters = {}
+        for key, combo in self.filter_combos.items():
+            if combo.isEnabled() and combo.currentText() != ALL:
+                filters[key] = combo.currentText()
+        return kind, filters
+
+    def reload(self):
+        """Start over from the newest entry with the current filters"""
+        self.cursor = None
+        self.table.setRowCount(0)
+        self.load_page()
+
+        kind, filters = self._filters()
+        counts = self.history.daily_counts(kind, issue_type=filters.get('issue_type'))
+        days = {}
+        for entry in counts:
+            days[entry['day']] = days.get(entry['day'], 0) + entry['count']
+        self.daily_label.setText("Per day: " + ", ".join(
+            f"{day}: {count}" for day, count in list(days.items())[:7]
+        ) if days else "No entries logged yet")
+
+    def load_page(self):
+        """Append the next page of entries"""
+        kind, filters = self._filters()
+        rows, self.cursor = self.history.page(
+            kind, limit=self.PAGE_SIZE, after=self.cursor, **filters
+        )
+        for entry in rows:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            values = [
+                entry['timestamp'],
+                entry['issue_type'],
+                entry.get('status') or entry.get('severity') or '',
+                entry['description'] or '',
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+        self.more_button.setEnabled(self.cursor is not None)
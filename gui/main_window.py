@@ -0,0 +1,37 @@
+from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget
+from gui.dashboard import DashboardWindow
+from gui.performance_view import PerformanceView
+from gui.process_view import ProcessView
+from gui.theme import init_window
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("PC Repair Tool")
+        self.setMinimumSize(800, 600)
+        init_window(self)
+        
+        # Create central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Create layout
+        layout = QVBoxLayout()
+        central_widget.setLayout(layout)
+        
+        # Add dashboard and live charts as tabs
+        self.tabs = QTabWidget()
+        self.dashboard = DashboardWindow()
+        self.tabs.addTab(self.dashboard, "Dashboard")
+        self.performance = PerformanceView()
+        self.tabs.addTab(self.performance, "Performance")
+        self.processes = ProcessView()
+        self.tabs.addTab(self.processes, "Processes")
+        layout.addWidget(self.tabs)
+
+    def closeEvent(self, event):
+        """Stop the background work of every tab"""
+        self.dashboard.close()
+        self.performance.stop()
+        self.processes.stop()
+        event.accept()
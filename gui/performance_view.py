@@ -0,0 +1,84 @@
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QComboBox, QScrollArea
+)
+
+from gui.charts import LineChart, SparklineGrid, format_percent, format_rate
+from modules.live_metrics import LiveMetrics
+
+class PerformanceView(QWidget):
+    """Live CPU, memory, disk and network charts, sampled once a second
+
+    Sampling continues while the view is hidden so the history is complete
+    when it is opened; hidden charts are never repainted.
+    """
+    INTERVAL_MS = 1000
+    SPANS = (("Last minute", 60), ("Last 10 minutes", 600), ("Last hour", 3600))
+    CORE_COLUMNS = 8
+
+    def __init__(self, metrics=None, parent=None):
+        super().__init__(parent)
+        self.metrics = metrics or LiveMetrics()
+        self.charts = []
+        self.setup_ui()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start(self.INTERVAL_MS)
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        span_layout = QHBoxLayout()
+        span_layout.addWidget(QLabel("Show:"))
+        self.span_combo = QComboBox()
+        for label, span in self.SPANS:
+            self.span_combo.addItem(label, span)
+        self.span_combo.currentIndexChanged.connect(self.change_span)
+        span_layout.addWidget(self.span_combo)
+        span_layout.addStretch()
+        layout.addLayout(span_layout)
+
+        buffers = self.metrics.buffers
+        span = self.span_combo.currentData()
+        chart_grid = QGridLayout()
+        for position, (name, title, value_range, formatter) in enumerate((
+            ('cpu_total', "CPU", (0, 100), format_percent),
+            ('memory', "Memory", (0, 100), format_percent),
+            ('disk', "Disk I/O", None, format_rate),
+            ('network', "Network", None, format_rate),
+        )):
+            chart = LineChart(buffers[name], title, self.metrics.labels(name),
+                              span=span, value_range=value_range, formatter=formatter)
+            chart_grid.addWidget(chart, position // 2, position % 2)
+            self.charts.append(chart)
+        layout.addLayout(chart_grid)
+
+        layout.addWidget(QLabel("Per core"))
+        cores = SparklineGrid(buffers['cpu'], self.metrics.labels('cpu'),
+                              columns=min(self.CORE_COLUMNS, self.metrics.cores), span=span)
+        self.charts.append(cores)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(cores)
+        layout.addWidget(scroll)
+
+        self.setLayout(layout)
+
+    def change_span(self):
+        span = self.span_combo.currentData()
+        for chart in self.charts:
+            chart.set_span(span)
+
+    def sample(self):
+        try:
+            self.metrics.sample()
+        except Exception:
+            return
+        if self.isVisible():
+            for chart in self.charts:
+                chart.update()
+
+    def stop(self):
+        self.timer.stop()
@@ -0,0 +1,158 @@
+from operator import attrgetter
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView
+
+from gui.workers import ProcessSampleWorker
+from modules.process_sampler import get_process_sampler
+
+def format_memory(rss):
+    return f"{rss / (1024 ** 2):.1f} MB"
+
+class ProcessTableModel(QAbstractTableModel):
+    """Sortable table of ProcessInfo rows
+
+    set_processes() swaps in a new sample as a layout change and remaps
+    persistent indexes by PID. The selected process stays selected and the
+    view keeps its scroll position, which a model reset would lose.
+    """
+    # (header, ProcessInfo field, formatter)
+    COLUMNS = (
+        ("PID", 'pid', str),
+        ("Name", 'name', str),
+        ("User", 'user', str),
+        ("CPU %", 'cpu_percent', "{:.1f}".format),
+        ("Memory", 'memory_rss', format_memory),
+        ("Memory %", 'memory_percent', "{:.1f}".format),
+        ("Threads", 'threads', str),
+        ("Status", 'status', str),
+    )
+    NUMERIC = {'pid', 'cpu_percent', 'memory_rss', 'memory_percent', 'threads'}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.processes = []
+        self.sort_column = 3
+        self.sort_order = Qt.SortOrder.DescendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.processes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        header, field, formatter = self.COLUMNS[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return formatter(getattr(self.processes[index.row()], field))
+        if role == Qt.ItemDataRole.TextAlignmentRole and field in self.NUMERIC:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self.set_processes(self.processes)
+
+    def _sorted(self, processes):
+        field = self.COLUMNS[self.sort_column][1]
+        return sorted(processes, key=attrgetter(field),
+                      reverse=self.sort_order == Qt.SortOrder.DescendingOrder)
+
+    def set_processes(self, processes):
+        processes = self._sorted(processes)
+        old, new = len(self.processes), len(processes)
+        if new > old:
+            self.beginInsertRows(QModelIndex(), old, new - 1)
+            self.processes.extend(processes[old:])
+            self.endInsertRows()
+        elif new < old:
+            self.beginRemoveRows(QModelIndex(), new, old - 1)
+            del self.processes[new:]
+            self.endRemoveRows()
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        pids = [self.processes[index.row()].pid for index in persistent]
+        self.processes = processes
+        rows = {process.pid: row for row, process in enumerate(processes)}
+        self.changePersistentIndexList(persistent, [
+            self.index(rows[pid], index.column()) if pid in rows else QModelIndex()
+            for pid, index in zip(pids, persistent)
+        ])
+        self.layoutChanged.emit()
+
+class ProcessView(QWidget):
+    """Process explorer, refreshed every couple of seconds while visible
+
+    Sampling runs on a ProcessSampleWorker. The refresh interval grows with
+    the time a refresh takes, so sampling uses at most about a tenth of one
+    core even on hosts with thousands of processes.
+    """
+    REFRESH_MS = 2000
+    MAX_LOAD = 0.1
+
+    def __init__(self, sampler=None, parent=None):
+        super().__init__(parent)
+        self.sampler = sampler or get_process_sampler()
+        self.worker = ProcessSampleWorker(self.sampler, self)
+        self.worker.processes_ready.connect(self.show_processes)
+        self.setup_ui()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.refresh)
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+
+        self.status_label = QLabel("Sampling processes...")
+        layout.addWidget(self.status_label)
+
+        self.model = ProcessTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Enabling sorting sorts by the header's indicator, so set it first
+        self.table.horizontalHeader().setSortIndicator(self.model.sort_column, self.model.sort_order)
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.verticalHeader().hide()
+        # Fixed row heights let the view skip measuring rows it never shows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 8)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def refresh(self):
+        if not self.worker.isRunning():
+            self.worker.start()
+
+    def show_processes(self, processes, elapsed):
+        self.model.set_processes(processes)
+        self.status_label.setText(
+            f"{len(processes)} processes, sampled in {elapsed * 1000:.0f} ms"
+        )
+        if self.isVisible():
+            self.timer.start(max(self.REFRESH_MS, int(elapsed / self.MAX_LOAD * 1000)))
+
+    def stop(self):
+        self.timer.stop()
+        self.worker.wait()
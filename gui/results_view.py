@@ -0,0 +1,175 @@
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QRectF, QSize
+)
+from PyQt6.QtGui import QColor, QFontMetrics, QPen
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle
+
+MessageTypeRole = Qt.ItemDataRole.UserRole + 1
+SeverityRole = Qt.ItemDataRole.UserRole + 2
+
+# Finding severities, most severe first, and the card each is drawn as
+SEVERITIES = ('critical', 'high', 'medium', 'low')
+SEVERITY_MESSAGE_TYPES = {'critical': 'error', 'high': 'error', 'medium': 'warning', 'low': 'warning'}
+
+# (background, text, border) per message type
+MESSAGE_COLORS = {
+    "error": ("#FFF5F5", "#C53030", "#FEB2B2"),  # Red theme
+    "warning": ("#FFFAF0", "#C05621", "#FBD38D"),  # Orange theme
+    "success": ("#F0FFF4", "#2F855A", "#9AE6B4"),  # Green theme
+    "info": ("#EBF8FF", "#2C5282", "#90CDF4")  # Blue theme
+}
+
+# The same cards for windows using the dark theme
+DARK_MESSAGE_COLORS = {
+    "error": ("#3B1F1F", "#FEB2B2", "#9B2C2C"),
+    "warning": ("#3B2A16", "#FBD38D", "#9C4221"),
+    "success": ("#1C3326", "#9AE6B4", "#276749"),
+    "info": ("#1A2B3C", "#90CDF4", "#2C5282")
+}
+
+class ResultsModel(QAbstractListModel):
+    """Flat list of (message, message_type, severity) results
+
+    severity is the finding's severity for scan findings and None for
+    other rows (plans, repair results, status messages).
+
+    Rows are only appended or cleared, so streaming results cost one
+    rowsInserted notification each instead of a new widget tree.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        message, message_type, severity = self.entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return message
+        if role == MessageTypeRole:
+            return message_type
+        if role == SeverityRole:
+            return severity
+        return None
+
+    def append(self, message, message_type="info", severity=None):
+        self.extend([(message, message_type, severity)])
+
+    def extend(self, entries):
+        """Append several (message, message_type, severity) results at once"""
+        entries = list(entries)
+        if not entries:
+            return
+        first = len(self.entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self.entries.extend(entries)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.entries = []
+        self.endResetModel()
+
+class ResultFilter(QSortFilterProxyModel):
+    """Shows findings whose severity, and other rows whose message type, is enabled"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.visible_types = set(MESSAGE_COLORS)
+        self.visible_severities = set(SEVERITIES)
+
+    def set_severity_visible(self, severity, visible):
+        if visible:
+            self.visible_severities.add(severity)
+        else:
+            self.visible_severities.discard(severity)
+        self.invalidateFilter()
+
+    def set_type_visible(self, message_type, visible):
+        if visible:
+            self.visible_types.add(message_type)
+        else:
+            self.visible_types.discard(message_type)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        severity = self.sourceModel().data(index, SeverityRole)
+        if severity is not None:
+            return severity in self.visible_severities
+        return self.sourceModel().data(index, MessageTypeRole) in self.visible_types
+
+class ResultDelegate(QStyledItemDelegate):
+    """Paints a result as a rounded, colour-coded card with wrapped text
+
+    Only rows inside the viewport are ever painted, and heights are cached
+    per (text, width), so thousands of results stay cheap.
+    """
+    MARGIN_X = 10
+    MARGIN_Y = 5
+    PADDING = 15
+    FLAGS = Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heights = {}
+
+    def _text_width(self, option):
+        width = option.widget.viewport().width() if option.widget else option.rect.width()
+        return max(width - 2 * (self.MARGIN_X + self.PADDING), 50)
+
+    def sizeHint(self, option, index):
+        text = index.data(Qt.ItemDataRole.DisplayRole) or ''
+        width = self._text_width(option)
+        key = (text, width)
+        height = self._heights.get(key)
+        if height is None:
+            font = option.font
+            font.setPixelSize(14)
+            rect = QFontMetrics(font).boundingRect(0, 0, width, 100000, self.FLAGS, text)
+            height = rect.height() + 2 * (self.MARGIN_Y + self.PADDING)
+            if len(self._heights) > 10000:
+                self._heights.clear()
+            self._heights[key] = height
+        return QSize(width, height)
+
+    def paint(self, painter, option, index):
+        message_type = index.data(MessageTypeRole)
+        colors = MESSAGE_COLORS
+        if option.widget and option.widget.window().property('theme') == 'dark':
+            colors = DARK_MESSAGE_COLORS
+        bg_color, text_color, border_color = colors.get(message_type, colors["info"])
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        card = QRectF(option.rect).adjusted(self.MARGIN_X, self.MARGIN_Y, -self.MARGIN_X, -self.MARGIN_Y)
+        border = QColor(border_color)
+        if option.state & QStyle.StateFlag.State_Selected:
+            border = QColor(text_color)
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(QColor(bg_color))
+        painter.drawRoundedRect(card, 8, 8)
+
+        font = option.font
+        font.setPixelSize(14)
+        font.setWeight(font.Weight.Medium)
+        painter.setFont(font)
+        painter.setPen(QColor(text_color))
+        painter.drawText(card.adjusted(self.PADDING, 0, -self.PADDING, 0), self.FLAGS,
+                         index.data(Qt.ItemDataRole.DisplayRole) or '')
+        painter.restore()
+
+class ResultsView(QListView):
+    """List view for a ResultsModel (usually behind a ResultFilter)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setItemDelegate(ResultDelegate(self))
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setWordWrap(True)
+        # Lay rows out in chunks so a huge append never blocks the event loop
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(200)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
@@ -0,0 +1,141 @@
+from PyQt6.QtWidgets import QFrame, QVBoxLayout, QGridLayout, QLabel, QWidget
+
+
+class SystemInfoPanel(QFrame):
+    """System Details panel whose sections are filled in as they arrive
+
+    The panel starts out with a placeholder for every section so it can be
+    shown before any information has been collected.
+    """
+    def __init__(self, section_names, parent=None):
+        super().__init__(parent)
+        self.sections = {}
+        self.setObjectName("systemInfoPanel")
+
+        self.main_layout = QVBoxLayout()
+        self.main_layout.setSpacing(20)
+        self.main_layout.setContentsMargins(20, 20, 20, 20)
+
+        for name in section_names:
+            self.add_section(name)
+
+        # Add stretch at the end to push everything up
+        self.main_layout.addStretch()
+        self.setLayout(self.main_layout)
+
+    def add_section(self, name):
+        """Create an empty section showing a loading placeholder"""
+        category_frame = QFrame()
+        category_frame.setObjectName("infoCategory")
+
+        category_layout = QVBoxLayout()
+
+        # Category Header
+        header = QLabel(name)
+        header.setObjectName("infoHeader")
+        category_layout.addWidget(header)
+
+        content = QWidget()
+        content.setLayout(self._placeholder_layout())
+        category_layout.addWidget(content)
+
+        category_frame.setLayout(category_layout)
+        # Keep sections above the trailing stretch
+        self.main_layout.insertWidget(len(self.sections), category_frame)
+        self.sections[name] = {'frame': category_frame, 'layout': category_layout, 'content': content}
+
+    def _placeholder_layout(self):
+        layout = QVBoxLayout()
+        placeholder = QLabel("Loading...")
+        placeholder.setObjectName("infoPlaceholder")
+        layout.addWidget(placeholder)
+        return layout
+
+    def set_section(self, name, items):
+        """Show the collected items of a section
+
+        The section's widgets are kept between refreshes: when the set of keys
+        is unchanged only the value labels whose text differs are updated, so
+        a refresh costs time in proportion to what actually changed. The grid
+        is only rebuilt when keys appear or disappear (e.g. a new mount).
+        """
+        if name not in self.sections:
+            self.add_section(name)
+        section = self.sections[name]
+
+        values = self._flatten(items)
+        if section.get('values') is not None and self._shape(section['values']) == self._shape(values):
+            labels = section['value_labels']
+            for path, text in values.items():
+                if section['values'][path] != text:
+                    labels[path].setText(text)
+            section['values'] = values
+            return
+
+        content = QWidget()
+        grid, section['value_labels'] = self._build_grid(items)
+        content.setLayout(grid)
+        section['layout'].replaceWidget(section['content'], content)
+        section['content'].deleteLater()
+        section['content'] = content
+        section['values'] = values
+
+    def _shape(self, values):
+        """The keys of a flattened section and whether each is a sub-header"""
+        return [(path, text is None) for path, text in values.items()]
+
+    def _flatten(self, items):
+        """Map the (key, subkey) path of every displayed value to its text"""
+        values = {}
+        if isinstance(items, dict):
+            for key, value in items.items():
+                if isinstance(value, dict):
+                    # A sub-section header has no value of its own
+                    values[(key,)] = None
+                    for subkey, subvalue in value.items():
+                        values[(key, subkey)] = str(subvalue)
+                else:
+                    values[(key,)] = str(value)
+        return values
+
+    def _build_grid(self, items):
+        # Create grid for items
+        grid = QGridLayout()
+        grid.setSpacing(10)
+        value_labels = {}
+        row = 0
+
+        if isinstance(items, dict):
+            for key, value in items.items():
+                if isinstance(value, dict):
+                    # Sub-section for nested dictionaries
+                    subheader = QLabel(key)
+                    subheader.setObjectName("infoSubheader")
+                    grid.addWidget(subheader, row, 0, 1, 2)
+                    row += 1
+
+                    for subkey, subvalue in value.items():
+                        key_label = QLabel(f"{subkey}:")
+                        key_label.setObjectName("infoKey")
+                        key_label.setProperty("nested", True)
+
+                        value_label = QLabel(str(subvalue))
+                        value_label.setObjectName("infoValue")
+
+                        grid.addWidget(key_label, row, 0)
+                        grid.addWidget(value_label, row, 1)
+                        value_labels[(key, subkey)] = value_label
+                        row += 1
+                else:
+                    key_label = QLabel(f"{key}:")
+                    key_label.setObjectName("infoKey")
+
+                    value_label = QLabel(str(value))
+                    value_label.setObjectName("infoValue")
+
+                    grid.addWidget(key_label, row, 0)
+                    grid.addWidget(value_label, row, 1)
+                    value_labels[(key,)] = value_label
+                    row += 1
+
+        return grid, value_labels
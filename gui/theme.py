@@ -0,0 +1,55 @@
+import os
+
+from PyQt6.QtWidgets import QApplication
+
+STYLESHEET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles.css')
+
+THEMES = ('light', 'dark')
+
+_theme = 'light'
+
+def load_stylesheet(path=STYLESHEET):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+def apply_theme(app, theme='light'):
+    """Install the application stylesheet; call once, before creating windows
+
+    Qt parses the sheet a single time here. Widgets then only need object
+    names and properties, never stylesheets of their own.
+    """
+    app.setStyleSheet(load_stylesheet())
+    set_theme(theme)
+
+def current_theme():
+    return _theme
+
+def init_window(window):
+    """Mark a new top-level window with the current theme"""
+    window.setProperty('theme', _theme)
+
+def set_theme(theme):
+    """Switch every window between the light and dark variants
+
+    The stylesheet is not re-parsed: the theme property changes on the
+    top-level windows, and one pass re-polishes the widgets so the
+    [theme="dark"] rules are re-evaluated.
+    """
+    global _theme
+    if theme not in THEMES:
+        raise ValueError(f'Unknown theme: {theme}')
+    _theme = theme
+
+    app = QApplication.instance()
+    if app is None:
+        return
+    for window in app.topLevelWidgets():
+        window.setProperty('theme', theme)
+    style = app.style()
+    for widget in app.allWidgets():
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
@@ -0,0 +1,82 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+
+class ScanWorker(QThread):
+    """Runs a SystemScanner off the GUI thread and streams its progress"""
+    progress_changed = pyqtSignal(int, str)
+    result_found = pyqtSignal(dict)
+    scan_finished = pyqtSignal(bool)
+
+    def __init__(self, scanner, parent=None):
+        super().__init__(parent)
+        self.scanner = scanner
+
+    def run(self):
+        self.scanner.start_scan(
+            progress_callback=self.progress_changed.emit,
+            result_callback=self.result_found.emit
+        )
+        self.scan_finished.emit(self.scanner.cancelled)
+
+    def cancel(self):
+        """Ask the scanner to stop after the check it is running"""
+        self.scanner.cancel()
+
+
+class RepairJobSignals(QObject):
+    """Signals for a repair Job running on a JobQueue worker thread
+
+    The job emits them from its worker thread; Qt queues the calls to the
+    slots on the GUI thread.
+    """
+    progress_changed = pyqtSignal(int, str)
+    result_ready = pyqtSignal(dict)
+    job_finished = pyqtSignal(str)
+
+
+class ProcessSampleWorker(QThread):
+    """Refreshes a ProcessSampler off the GUI thread"""
+    processes_ready = pyqtSignal(list, float)
+
+    def __init__(self, sampler, parent=None):
+        super().__init__(parent)
+        self.sampler = sampler
+
+    def run(self):
+        started = time.monotonic()
+        try:
+            processes = self.sampler.refresh()
+        except Exception:
+            return
+        self.processes_ready.emit(processes, time.monotonic() - started)
+
+
+class SystemInfoWorker(QThread):
+    """Collects the System Details sections in the background
+
+    Every section collector runs concurrently and section_ready is emitted as
+    soon as one finishes, so fast sections show up without waiting for slow
+    ones such as system_profiler.
+    """
+    section_ready = pyqtSignal(str, dict)
+
+    def __init__(self, collector, dynamic_only=False, parent=None):
+        super().__init__(parent)
+        self.collector = collector
+        self.dynamic_only = dynamic_only
+
+    def run(self):
+        sections = self.collector.sections(dynamic_only=self.dynamic_only)
+        if not sections:
+            return
+        with ThreadPoolExecutor(max_workers=len(sections), thread_name_prefix='system-info') as executor:
+            futures = {executor.submit(collect): name for name, collect in sections}
+            for future in as_completed(futures):
+                try:
+                    items = future.result()
+                except Exception as e:
+                    items = {"Error": f"Unable to collect information: {str(e)}"}
+                self.section_ready.emit(futures[future], items)
@@ -1,30 +1,27 @@
 import sys
-from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-from gui.dashboard import DashboardWindow
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("PC Repair Tool")
-        self.setMinimumSize(800, 600)
-        
-        # Create central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # Create layout
-        layout = QVBoxLayout()
-        central_widget.setLayout(layout)
-        
-        # Add dashboard
-        dashboard = DashboardWindow()
-        layout.addWidget(dashboard)
+from modules.cli import COMMANDS
+from modules.privileged_helper import HELPER_ARG
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == HELPER_ARG:
+        from modules.privileged_helper import main as helper_main
+        sys.exit(helper_main(sys.argv[2:]))
+
+    # Headless commands must never pull in PyQt6
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS + ('-h', '--help'):
+        from modules.cli import run
+        sys.exit(run(sys.argv[1:]))
+
+    from PyQt6.QtWidgets import QApplication
+    from gui.main_window import MainWindow
+    from gui.theme import apply_theme
+
     app = QApplication(sys.argv)
+    # Parse the application stylesheet once, before any widget exists
+    apply_theme(app)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,34 @@
+import os
+import platform
+
+APP_NAME = 'pc_repair'
+
+def cache_dir():
+    """Per-user directory for data that can be rebuilt at any time"""
+    if platform.system() == "Darwin":
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    path = os.path.join(base, APP_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def data_dir():
+    """Per-user directory for data that must persist, such as the database"""
+    if platform.system() == "Darwin":
+        base = os.path.expanduser('~/Library/Application Support')
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+    path = os.path.join(base, APP_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def log_dir():
+    """Per-user directory for the rotated event logs"""
+    if platform.system() == "Darwin":
+        path = os.path.expanduser(f'~/Library/Logs/{APP_NAME}')
+    else:
+        base = os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state')
+        path = os.path.join(base, APP_NAME, 'logs')
+    os.makedirs(path, exist_ok=True)
+    return path
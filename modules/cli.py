@@ -0,0 +1,198 @@
+"""Headless command line interface
+
+Only depends on modules/ and psutil so it can run over SSH or from cron on
+machines without a display; nothing here may import PyQt6.
+"""
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+
+COMMANDS = ('scan', 'diagnose', 'repair', 'history')
+
+# Exit codes
+EXIT_HEALTHY = 0
+EXIT_ISSUES_FOUND = 1
+EXIT_ERROR = 2
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='pc_repair',
+        description='PC Repair Tool. Run without a command to open the GUI.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan = commands.add_parser('scan', help='Scan the system for issues')
+    scan.add_argument('--json', action='store_true', help='Print the results as JSON')
+    scan.add_argument('--sequential', action='store_true',
+                      help='Run checks one after another instead of concurrently')
+
+    diagnose = commands.add_parser('diagnose', help='Run the full diagnostic report')
+    diagnose.add_argument('--json', action='store_true', help='Print the report as JSON')
+    diagnose.add_argument('--output', metavar='FILE', help='Also write the JSON report to FILE')
+
+    repair = commands.add_parser('repair', help='Scan and fix the issues found')
+    repair.add_argument('--dry-run', action='store_true', help='Only show what would be fixed')
+    repair.add_argument('--json', action='store_true', help='Print the results as JSON')
+
+    history = commands.add_parser('history', help='Browse logged repairs and scan findings')
+    history.add_argument('kind', nargs='?', choices=('repair', 'scan'), default='repair')
+    history.add_argument('--since', metavar='AGE',
+                         help='Only entries newer than AGE, e.g. 30m, 12h or 7d')
+    history.add_argument('--type', dest='issue_type', help='Only this issue type')
+    history.add_argument('--status', help='Only this status (repairs)')
+    history.add_argument('--severity', help='Only this severity')
+    history.add_argument('--limit', type=int, default=50, help='Entries per page (default: 50)')
+    history.add_argument('--after', metavar='CURSOR', help='Continue after the cursor a previous page printed')
+    history.add_argument('--daily', action='store_true', help='Show counts per day and issue type')
+    history.add_argument('--json', action='store_true', help='Print the results as JSON')
+
+    return parser
+
+def run(argv=None):
+    """Run a CLI command and return its exit code"""
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == 'scan':
+            return _scan(args)
+        if args.command == 'diagnose':
+            return _diagnose(args)
+        if args.command == 'repair':
+            return _repair(args)
+        if args.command == 'history':
+            return _history(args)
+    except KeyboardInterrupt:
+        return EXIT_ERROR
+    except Exception as e:
+        print(f'Error: {str(e)}', file=sys.stderr)
+        return EXIT_ERROR
+    return EXIT_ERROR
+
+def _scan(args):
+    from modules.scan_system import SystemScanner
+
+    scanner = SystemScanner(concurrent=not args.sequential)
+    scanner.start_scan()
+    issues = scanner.get_results()
+
+    if args.json:
+        _print_json({'timestamp': _timestamp(), 'issues': issues})
+    else:
+        _print_issues(issues)
+    return EXIT_ISSUES_FOUND if issues else EXIT_HEALTHY
+
+def _diagnose(args):
+    from modules.diagnostics import SystemDiagnostics
+
+    diagnostics = SystemDiagnostics()
+    report = diagnostics.run_full_diagnostics()
+    if args.output:
+        diagnostics.export_report(args.output)
+
+    if args.json:
+        _print_json(report)
+    else:
+        for key, value in report['system_info'].items():
+            print(f'{key}: {value}')
+        print()
+        _print_issues([
+            {'severity': issue['severity'], 'description': f"{issue['component']}: {issue['description']}"}
+            for issue in report['issues']
+        ])
+        for recommendation in report['recommendations']:
+            print(f'  -> {recommendation}')
+        for metric, windows in report['history'].items():
+            print(f'{metric}: ' + ', '.join(
+                f"{name.replace('_', ' ')} avg {summary['avg']} (min {summary['min']}, max {summary['max']})"
+                for name, summary in windows.items() if summary
+            ))
+        logs = report['system_logs']
+        if logs:
+            print(f"system log errors since {logs['since']}: {logs['errors']}"
+                  + ('' if logs['complete'] else '+')
+                  + ''.join(f"\n  {name}: {errors}" for name, errors in logs['subsystems'].items()))
+    return EXIT_ISSUES_FOUND if report['issues'] else EXIT_HEALTHY
+
+def _repair(args):
+    from modules.scan_system import SystemScanner
+    from modules.repair import SystemRepair
+
+    scanner = SystemScanner(concurrent=True)
+    scanner.start_scan()
+    issues = scanner.get_results()
+
+    repair = SystemRepair()
+    plan = repair.plan(issues)
+    if not args.json:
+        _print_issues(issues)
+        for line in plan.describe():
+            print(f'  plan {line}')
+
+    repair.fix_issues(issues, dry_run=args.dry_run)
+    results = repair.get_results()
+
+    if args.json:
+        _print_json({
+            'timestamp': _timestamp(),
+            'dry_run': args.dry_run,
+            'issues': issues,
+            'plan': plan.as_dict(),
+            'results': results
+        })
+    else:
+        for result in results:
+            marker = 'WOULD' if result.get('dry_run') else ('OK' if result.get('success') else 'FAILED')
+            print(f'[{marker}] {result.get("result", "Unknown result")}')
+
+    if any(not result.get('success', False) for result in results):
+        return EXIT_ERROR
+    return EXIT_ISSUES_FOUND if issues and args.dry_run else EXIT_HEALTHY
+
+def _parse_age(text):
+    """'30m', '12h' or '7d' as a timedelta"""
+    units = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+    if not text or text[-1] not in units or not text[:-1].isdigit():
+        raise ValueError(f'Invalid age {text!r}; use e.g. 30m, 12h or 7d')
+    return timedelta(**{units[text[-1]]: int(text[:-1])})
+
+def _history(args):
+    from database.history import LogHistory, format_cursor, parse_cursor
+
+    history = LogHistory()
+    start = datetime.now(timezone.utc) - _parse_age(args.since) if args.since else None
+
+    if args.daily:
+        counts = history.daily_counts(args.kind, start=start, issue_type=args.issue_type)
+        if args.json:
+            _print_json(counts)
+        else:
+            for entry in counts:
+                print(f"{entry['day']}  {entry['issue_type']:<20} {entry['count']}")
+        return EXIT_HEALTHY
+
+    rows, cursor = history.page(
+        args.kind, start=start, issue_type=args.issue_type, status=args.status,
+        severity=args.severity, limit=args.limit, after=parse_cursor(args.after)
+    )
+    if args.json:
+        _print_json({'entries': rows, 'next': format_cursor(cursor)})
+    else:
+        for row in rows:
+            label = row.get('status') or row.get('severity') or ''
+            print(f"{row['timestamp']}  [{label.upper()}] {row['issue_type']}: {row['description']}")
+        if cursor:
+            print(f'More entries: --after "{format_cursor(cursor)}"')
+    return EXIT_HEALTHY
+
+def _print_issues(issues):
+    if not issues:
+        print('No issues found - System is healthy!')
+    for issue in issues:
+        print(f"[{issue.get('severity', 'medium').upper()}] {issue['description']}")
+
+def _print_json(data):
+    json.dump(data, sys.stdout, indent=4, default=str)
+    print()
+
+def _timestamp():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -0,0 +1,99 @@
+import os
+import shlex
+import signal
+import subprocess
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+CommandResult = namedtuple('CommandResult', 'stdout returncode timed_out truncated error')
+
+class CommandRunner:
+    """Runs external commands without a shell, bounded in time and output
+
+    Every command is killed once it exceeds its timeout, and its output is cut
+    off (and the command killed) after max_output bytes. run_many() runs a set
+    of commands on a bounded thread pool, so the total time approaches the
+    slowest single command, and returns whatever finished even when some of
+    them hang.
+    """
+    def __init__(self, timeout=10, max_output=1024 * 1024, max_workers=8):
+        self.timeout = timeout
+        self.max_output = max_output
+        self.max_workers = max_workers
+
+    def run(self, command, timeout=None):
+        """Run one command given as an argument list (or a string to split)"""
+        if isinstance(command, str):
+            command = shlex.split(command)
+        timeout = self.timeout if timeout is None else timeout
+
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                # Own process group, so helpers it spawns are killed with it
+                start_new_session=(os.name == 'posix')
+            )
+        except Exception as e:
+            return CommandResult('', None, False, False, str(e))
+
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            self._kill(process)
+
+        # Killing the process closes its end of the pipe, which ends the read loop
+        timer = threading.Timer(timeout, kill)
+        timer.daemon = True
+        timer.start()
+
+        chunks = []
+        size = 0
+        truncated = False
+        try:
+            while True:
+                chunk = process.stdout.read1(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self.max_output:
+                    truncated = True
+                    self._kill(process)
+                    break
+        finally:
+            timer.cancel()
+            process.stdout.close()
+            returncode = process.wait()
+
+        stdout = b''.join(chunks)[:self.max_output].decode('utf-8', errors='replace')
+        error = f'Timed out after {timeout}s' if timed_out.is_set() else None
+        return CommandResult(stdout.strip(), returncode, timed_out.is_set(), truncated, error)
+
+    @staticmethod
+    def _kill(process):
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass
+
+    def run_many(self, commands, timeouts=None):
+        """Run {key: command} concurrently and return {key: CommandResult}
+
+        timeouts optionally maps keys to their own timeout in seconds.
+        """
+        if not commands:
+            return {}
+        timeouts = timeouts or {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(commands)),
+                                thread_name_prefix='command') as executor:
+            futures = {key: executor.submit(self.run, command, timeouts.get(key))
+                       for key, command in commands.items()}
+            return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import deque
+
+import psutil
+
+class CpuSampler:
+    """Background sampler of per-core CPU times
+
+    A daemon thread reads psutil.cpu_times(percpu=True) every `interval`
+    seconds into a fixed-size ring buffer covering `history` seconds. Readers
+    compute windowed utilisation from two buffered samples, so asking for the
+    1s, 10s or 60s average never blocks once the sampler has warmed up.
+    """
+    WINDOWS = (1, 10, 60)
+
+    def __init__(self, interval=0.5, history=60):
+        self.interval = interval
+        self.samples = deque(maxlen=int(history / interval) + 2)
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Take the first sample and start the sampling thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._take_sample()
+        self._thread = threading.Thread(target=self._run, name='cpu-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the sampling thread"""
+        self._stopped.set()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self._take_sample()
+            except Exception:
+                continue
+
+    def _take_sample(self):
+        sample = (time.monotonic(), [self._busy_total(t) for t in psutil.cpu_times(percpu=True)])
+        with self._lock:
+            self.samples.append(sample)
+            if len(self.samples) > 1:
+                self._ready.set()
+
+    @staticmethod
+    def _busy_total(times):
+        """Split a cpu_times entry into (busy, total) seconds"""
+        total = sum(times)
+        # Guest time is already accounted for in user/nice on Linux
+        total -= getattr(times, 'guest', 0) + getattr(times, 'guest_nice', 0)
+        idle = times.idle + getattr(times, 'iowait', 0)
+        return total - idle, total
+
+    def percent(self, window=1, percpu=False):
+        """Average CPU utilisation over the last `window` seconds
+
+        Only the very first read after start() may wait, for at most one
+        sampling interval; if less history than `window` has been collected the
+        average covers what is available.
+        """
+        if not self._ready.is_set():
+            self._ready.wait(self.interval * 2)
+
+        with self._lock:
+            if len(self.samples) < 2:
+                return [0.0] * len(self.samples[-1][1]) if percpu and self.samples else 0.0
+            latest_time, latest = self.samples[-1]
+            base = self.samples[0][1]
+            for sample_time, cores in reversed(self.samples):
+                if latest_time - sample_time >= window:
+                    base = cores
+                    break
+
+        per_core = []
+        for (busy, total), (old_busy, old_total) in zip(latest, base):
+            elapsed = total - old_total
+            per_core.append(round(max(0.0, min(100.0, (busy - old_busy) / elapsed * 100)), 1) if elapsed > 0 else 0.0)
+
+        if percpu:
+            return per_core
+        return round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+
+    def averages(self):
+        """1s, 10s and 60s overall averages keyed by window length"""
+        return {window: self.percent(window) for window in self.WINDOWS}
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+def get_sampler():
+    """Return the shared, already running CpuSampler"""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = CpuSampler()
+            _sampler.start()
+        return _sampler
@@ -1,19 +1,44 @@
 import psutil
 import os
 import platform
-import subprocess
 import shutil
 import json
+import time
 from datetime import datetime
 
+from modules.linux_system_info import LinuxSystemInfo
+from modules.metrics_recorder import collect_samples
+from modules.process_sampler import describe_top, top_processes
+from modules.system_log_reader import SystemLogReader
+from modules.system_snapshot import get_disk_snapshot, get_snapshot
+from database.metrics_store import get_metrics_store
+
 class SystemDiagnostics:
     def __init__(self):
         self.system_info = {}
         self.issues = []
         self.recommendations = []
+        self.history = {}
+        self.system_logs = {}
+        self.snapshot = None
+
+    # Metrics summarised in the report's history section
+    HISTORY_METRICS = ('cpu.percent', 'memory.percent', 'swap.percent', 'temperature.max')
+    HISTORY_WINDOWS = {'last_hour': 3600, 'last_day': 86400, 'last_week': 7 * 86400}
+    # Processes named in a high CPU or memory finding
+    TOP_PROCESSES = 5
+    # Logged errors above which the system logs are reported, and the
+    # subsystems listed in that finding
+    LOG_ERROR_THRESHOLD = 10
+    TOP_SUBSYSTEMS = 3
 
     def run_full_diagnostics(self):
-        """Run all diagnostic checks"""
+        """Run all diagnostic checks
+
+        CPU, memory, disk, network and uptime thresholds are evaluated
+        against one shared SystemSnapshot.
+        """
+        self.snapshot = get_snapshot()
         self._check_system_info()
         self._check_cpu_health()
         self._check_memory_health()
@@ -23,10 +48,22 @@ class SystemDiagnostics:
         self._check_temperature()
         self._check_startup_items()
         self._check_system_logs()
+        self._record_metrics()
         return self.generate_report()
 
+    def _snapshot(self):
+        """The snapshot of the running diagnostics; checks called on their own take one"""
+        if self.snapshot is None:
+            self.snapshot = get_snapshot()
+        return self.snapshot
+
     def _check_system_info(self):
         """Gather basic system information"""
+        snapshot = self._snapshot()
+        root = get_disk_snapshot().mount('/')
+        # Never stat '/' here: if DiskProbe could not, it may well be hung
+        total_disk = (f"{root.usage.total / (1024**3):.2f} GB"
+                      if root and root.status == 'ok' else 'Unknown')
         self.system_info = {
             'os': platform.system(),
             'os_version': platform.version(),
@@ -34,22 +71,36 @@ class SystemDiagnostics:
             'processor': platform.processor(),
             'hostname': platform.node(),
             'python_version': platform.python_version(),
-            'total_ram': f"{psutil.virtual_memory().total / (1024**3):.2f} GB",
-            'total_disk': f"{psutil.disk_usage('/').total / (1024**3):.2f} GB",
-            'cpu_cores': psutil.cpu_count(),
-            'boot_time': datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S')
+            'total_ram': f"{snapshot.memory.total / (1024**3):.2f} GB",
+            'total_disk': total_disk,
+            'cpu_cores': len(snapshot.cpu_per_core) or psutil.cpu_count(),
+            'boot_time': datetime.fromtimestamp(snapshot.boot_time).strftime('%Y-%m-%d %H:%M:%S')
         }
 
+        if platform.system() == "Linux":
+            # platform.processor() is empty on Linux; read the details from /proc and /sys
+            linux = LinuxSystemInfo()
+            linux.get_os_info()
+            linux.get_hardware_info()
+            self.system_info.update({
+                'processor': linux.system_info['hardware']['processor_name'],
+                'model': linux.system_info['hardware']['model_name'],
+                'distribution': f"{linux.system_info['os']['product_name']} "
+                                f"{linux.system_info['os']['product_version']}".strip()
+            })
+
     def _check_cpu_health(self):
         """Check CPU usage and performance"""
-        cpu_percent = psutil.cpu_percent(interval=1, percpu=True)
-        avg_cpu = sum(cpu_percent) / len(cpu_percent)
+        avg_cpu = self._snapshot().cpu_percent
         
         if avg_cpu > 80:
+            processes = top_processes(self.TOP_PROCESSES, 'cpu_percent')
             self.issues.append({
                 'component': 'CPU',
                 'severity': 'high',
-                'description': f'High CPU usage detected: {avg_cpu:.1f}%'
+                'description': f'High CPU usage detected: {avg_cpu:.1f}% '
+                               f'(top: {describe_top(processes, "cpu_percent")})',
+                'processes': processes
             })
             self.recommendations.append(
                 'Consider closing resource-intensive applications or scanning for malware'
@@ -57,12 +108,15 @@ class SystemDiagnostics:
 
     def _check_memory_health(self):
         """Check memory usage and performance"""
-        mem = psutil.virtual_memory()
+        mem = self._snapshot().memory
         if mem.percent > 80:
+            processes = top_processes(self.TOP_PROCESSES, 'memory_percent')
             self.issues.append({
                 'component': 'Memory',
                 'severity': 'high',
-                'description': f'High memory usage: {mem.percent}%'
+                'description': f'High memory usage: {mem.percent}% '
+                               f'(top: {describe_top(processes, "memory_percent")})',
+                'processes': processes
             })
             self.recommendations.append(
                 'Consider closing unused applications or increasing RAM'
@@ -78,24 +132,31 @@ class SystemDiagnostics:
 
     def _check_disk_health(self):
         """Check disk space and performance"""
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                if usage.percent > 85:
-                    self.issues.append({
-                        'component': 'Disk',
-                        'severity': 'medium',
-                        'description': f'Low disk space on {partition.mountpoint}: {usage.percent}%'
-                    })
-                    self.recommendations.append(
-                        f'Clean up disk space on {partition.mountpoint}'
-                    )
-            except Exception:
-                continue
+        for mount in get_disk_snapshot().mounts:
+            if mount.status == 'timeout':
+                self.issues.append({
+                    'component': 'Disk',
+                    'severity': 'medium',
+                    'description': f'Mount {mount.mountpoint} ({mount.fstype}) is not responding'
+                })
+                self.recommendations.append(
+                    f'Check the connection to {mount.device} or unmount {mount.mountpoint}'
+                )
+            elif mount.status == 'ok' and mount.usage.percent > 85:
+                self.issues.append({
+                    'component': 'Disk',
+                    'severity': 'medium',
+                    'description': f'Low disk space on {mount.mountpoint}: {mount.usage.percent}%'
+                })
+                self.recommendations.append(
+                    f'Clean up disk space on {mount.mountpoint}'
+                )
 
     def _check_network_health(self):
         """Check network connectivity and performance"""
-        net_io = psutil.net_io_counters()
+        net_io = self._snapshot().net_io
+        if net_io is None:
+            return
         if net_io.packets_sent == 0 or net_io.packets_recv == 0:
             self.issues.append({
                 'component': 'Network',
@@ -153,18 +214,48 @@ class SystemDiagnostics:
                     )
 
     def _check_system_logs(self):
-        """Check system logs for errors"""
+        """Check system logs for errors logged since the previous check"""
+        self.system_logs = {}
         if platform.system() == "Darwin":  # macOS
             try:
-                log_output = subprocess.check_output(['log', 'show', '--last', '1h', '--predicate', 'eventMessage contains "error"']).decode()
-                if len(log_output.split('\n')) > 10:
-                    self.issues.append({
-                        'component': 'System Logs',
-                        'severity': 'medium',
-                        'description': 'Multiple system errors detected in logs'
-                    })
+                summary = SystemLogReader().read()
             except Exception:
-                pass
+                return
+            self.system_logs = {
+                'since': summary.since.strftime('%Y-%m-%d %H:%M:%S'),
+                'errors': summary.errors,
+                'complete': not (summary.stopped_early or summary.timed_out),
+                'subsystems': dict(summary.subsystems.most_common())
+            }
+            if summary.errors > self.LOG_ERROR_THRESHOLD:
+                count = f"{summary.errors}+" if summary.stopped_early else str(summary.errors)
+                top = ', '.join(f'{name} ({errors})' for name, errors
+                                in summary.subsystems.most_common(self.TOP_SUBSYSTEMS))
+                self.issues.append({
+                    'component': 'System Logs',
+                    'severity': 'medium',
+                    'description': f'{count} system errors logged since '
+                                   f'{self.system_logs["since"]} (top: {top})',
+                    'subsystems': self.system_logs['subsystems']
+                })
+
+    def _record_metrics(self):
+        """Store the current readings and summarise the recorded history"""
+        try:
+            store = get_metrics_store()
+            store.record(collect_samples(snapshot=self._snapshot())[0])
+            now = time.time()
+            self.history = {}
+            for metric in self.HISTORY_METRICS:
+                windows = {
+                    name: store.summary(metric, now - seconds, now)
+                    for name, seconds in self.HISTORY_WINDOWS.items()
+                }
+                if any(windows.values()):
+                    self.history[metric] = windows
+        except Exception:
+            # History is informative only; diagnostics work without the database
+            self.history = {}
 
     def generate_report(self):
         """Generate a complete diagnostic report"""
@@ -172,7 +263,9 @@ class SystemDiagnostics:
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'system_info': self.system_info,
             'issues': self.issues,
-            'recommendations': self.recommendations
+            'recommendations': self.recommendations,
+            'history': self.history,
+            'system_logs': self.system_logs
         }
 
     def export_report(self, filename='diagnostic_report.json'):
@@ -0,0 +1,150 @@
+import fnmatch
+import queue
+import threading
+import time
+
+import psutil
+
+# Mountpoints whose abandoned statvfs() has not returned yet, with the time
+# it was started. Shared by all probes so a hung mount holds one thread at most.
+_hung = {}
+_hung_lock = threading.Lock()
+
+class DiskProbe:
+    """Probe mounted filesystems in parallel with a bounded time per mount
+
+    A stale NFS/SMB/FUSE mount can block statvfs() forever, so every mount is
+    probed on a daemon worker thread. A worker stuck past the per-mount timeout
+    is abandoned and replaced, the mount is reported as 'timeout', and the probe
+    carries on with the rest. Until the abandoned call returns, later probes
+    report that mount as 'timeout' straight away instead of starting another
+    thread that would hang as well. Bind mounts of the same device are only probed
+    once, so hosts with hundreds of mounts finish in roughly constant time.
+    """
+    DEFAULT_EXCLUDE_FSTYPES = ('squashfs', 'iso9660', 'udf', 'autofs', 'devfs', 'nullfs')
+    DEFAULT_EXCLUDE_MOUNTPOINTS = ('/snap/*', '/var/snap/*', '/var/lib/docker/*', '/System/Volumes/VM')
+
+    def __init__(self, timeout=2.0, max_workers=16,
+                 include_fstypes=None, exclude_fstypes=DEFAULT_EXCLUDE_FSTYPES,
+                 include_mountpoints=None, exclude_mountpoints=DEFAULT_EXCLUDE_MOUNTPOINTS):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.include_fstypes = include_fstypes
+        self.exclude_fstypes = exclude_fstypes
+        self.include_mountpoints = include_mountpoints
+        self.exclude_mountpoints = exclude_mountpoints
+
+    def probe(self, partitions=None):
+        """Return a usage record for every selected mount
+
+        Each record is a dict with device, mountpoint, fstype, status ('ok',
+        'timeout' or 'error'), usage (a psutil disk_usage result or None) and
+        error.
+        """
+        if partitions is None:
+            partitions = psutil.disk_partitions()
+        partitions = [p for p in partitions if self._selected(p)]
+
+        # Group bind mounts so each device is only statted once
+        groups = {}
+        for partition in partitions:
+            key = partition.device if partition.device not in ('', 'none') else partition.mountpoint
+            groups.setdefault(key, []).append(partition)
+
+        probed = self._probe_all([members[0] for members in groups.values()])
+
+        records = []
+        for members in groups.values():
+            record = probed[members[0].mountpoint]
+            for partition in members:
+                records.append(dict(
+                    record,
+                    device=partition.device,
+                    mountpoint=partition.mountpoint,
+                    fstype=partition.fstype
+                ))
+        return records
+
+    def _selected(self, partition):
+        """Apply the fstype and mountpoint include/exclude filters"""
+        fstype = partition.fstype
+        if self.include_fstypes is not None and fstype not in self.include_fstypes:
+            return False
+        if self.exclude_fstypes and fstype in self.exclude_fstypes:
+            return False
+        mountpoint = partition.mountpoint
+        if self.include_mountpoints is not None and not any(
+                fnmatch.fnmatch(mountpoint, pattern) for pattern in self.include_mountpoints):
+            return False
+        if self.exclude_mountpoints and any(
+                fnmatch.fnmatch(mountpoint, pattern) for pattern in self.exclude_mountpoints):
+            return False
+        return True
+
+    def _probe_all(self, partitions):
+        """Stat every partition on daemon workers, abandoning hung ones"""
+        results = {}
+        now = time.monotonic()
+        with _hung_lock:
+            for partition in partitions:
+                started = _hung.get(partition.mountpoint)
+                if started is not None:
+                    results[partition.mountpoint] = {
+                        'status': 'timeout',
+                        'usage': None,
+                        'error': f'No response for {now - started:.0f}s'
+                    }
+
+        pending = queue.Queue()
+        for partition in partitions:
+            if partition.mountpoint not in results:
+                pending.put(partition)
+        running = {}
+        finished = threading.Condition()
+
+        def worker():
+            while True:
+                try:
+                    partition = pending.get_nowait()
+                except queue.Empty:
+                    return
+                with finished:
+                    running[partition.mountpoint] = (partition, time.monotonic())
+
+                try:
+                    record = {'status': 'ok', 'usage': psutil.disk_usage(partition.mountpoint), 'error': None}
+                except Exception as e:
+                    record = {'status': 'error', 'usage': None, 'error': str(e)}
+
+                with finished:
+                    if partition.mountpoint in results:
+                        # Already reported as timed out and replaced; retire
+                        with _hung_lock:
+                            _hung.pop(partition.mountpoint, None)
+                        return
+                    running.pop(partition.mountpoint, None)
+                    results[partition.mountpoint] = record
+                    finished.notify_all()
+
+        def start_worker():
+            threading.Thread(target=worker, name='disk-probe', daemon=True).start()
+
+        for _ in range(min(self.max_workers, pending.qsize())):
+            start_worker()
+
+        with finished:
+            while len(results) < len(partitions):
+                finished.wait(0.05)
+                now = time.monotonic()
+                for mountpoint, (partition, started) in list(running.items()):
+                    if now - started >= self.timeout:
+                        del running[mountpoint]
+                        with _hung_lock:
+                            _hung[mountpoint] = started
+                        results[mountpoint] = {
+                            'status': 'timeout',
+                            'usage': None,
+                            'error': f'No response after {self.timeout:g}s'
+                        }
+                        start_worker()
+        return results
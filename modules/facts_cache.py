@@ -0,0 +1,107 @@
+import json
+import os
+import platform
+import tempfile
+import threading
+
+import psutil
+
+from modules.app_paths import cache_dir
+
+class FactsCache:
+    """Persistent cache for system facts that cannot change within a boot
+
+    Facts such as the hardware model, serial number, core counts or OS build
+    are collected once and stored on disk together with the boot time and OS
+    version. The whole cache is discarded after a reboot or an OS update.
+    """
+    # psutil derives boot_time from uptime, so it can drift by a second
+    BOOT_TIME_TOLERANCE = 2
+
+    def __init__(self, path=None):
+        if path is None:
+            try:
+                path = os.path.join(cache_dir(), 'facts.json')
+            except OSError:
+                # No writable cache directory; keep the facts in memory only
+                path = None
+        self.path = path
+        self._lock = threading.Lock()
+        self._facts = None
+
+    def get(self, name, loader):
+        """Return the cached fact `name`, calling loader() to collect it once
+
+        If loader raises, nothing is cached and the exception propagates.
+        """
+        with self._lock:
+            facts = self._load()
+            if name in facts:
+                return facts[name]
+
+        value = loader()
+
+        with self._lock:
+            self._facts[name] = value
+            self._save()
+        return value
+
+    def has(self, name):
+        """Whether `name` is cached and still valid"""
+        with self._lock:
+            return name in self._load()
+
+    def invalidate(self):
+        """Drop every cached fact"""
+        with self._lock:
+            self._facts = {}
+            self._save()
+
+    def _validity(self):
+        return {
+            'boot_time': psutil.boot_time(),
+            'os': f"{platform.system()} {platform.release()} {platform.version()}"
+        }
+
+    def _load(self):
+        if self._facts is not None:
+            return self._facts
+
+        self._facts = {}
+        if not self.path:
+            return self._facts
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+            validity = self._validity()
+            if (stored.get('os') == validity['os'] and
+                    abs(stored.get('boot_time', 0) - validity['boot_time']) <= self.BOOT_TIME_TOLERANCE):
+                self._facts = stored.get('facts', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return self._facts
+
+    def _save(self):
+        if not self.path:
+            return
+        data = dict(self._validity(), facts=self._facts)
+        try:
+            # Write atomically so a concurrent reader never sees half a file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+_facts_cache = None
+_facts_cache_lock = threading.Lock()
+
+def get_facts_cache():
+    """Return the shared FactsCache"""
+    global _facts_cache
+    with _facts_cache_lock:
+        if _facts_cache is None:
+            _facts_cache = FactsCache()
+        return _facts_cache
@@ -0,0 +1,86 @@
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class Job:
+    """A unit of background work that can be cancelled cooperatively
+
+    func is called with no arguments on a JobQueue worker. cancel() marks the
+    job as cancelled; a queued job never starts, and for a running job the
+    cancel callback is invoked so the work can stop at its next checkpoint.
+    on_finished(job) is called on the worker once the job has ended.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    _ids = itertools.count(1)
+
+    def __init__(self, func, description='', cancel=None, on_finished=None):
+        self.id = next(self._ids)
+        self.func = func
+        self.description = description
+        self.status = self.QUEUED
+        self.result = None
+        self.error = None
+        self._cancel = cancel
+        self._on_finished = on_finished
+        self._lock = threading.Lock()
+        self._cancel_requested = False
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_requested
+
+    def cancel(self):
+        """Request cancellation"""
+        with self._lock:
+            self._cancel_requested = True
+            running = self.status == self.RUNNING
+        if running and self._cancel:
+            self._cancel()
+
+    def run(self):
+        with self._lock:
+            if self._cancel_requested:
+                self.status = self.CANCELLED
+            else:
+                self.status = self.RUNNING
+
+        if self.status == self.RUNNING:
+            try:
+                self.result = self.func()
+                self.status = self.CANCELLED if self._cancel_requested else self.DONE
+            except Exception as e:
+                self.error = str(e)
+                self.status = self.FAILED
+
+        if self._on_finished:
+            self._on_finished(self)
+        return self.result
+
+class JobQueue:
+    """Runs submitted Jobs in order on a background executor"""
+    def __init__(self, max_workers=1):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self.jobs = []
+
+    def submit(self, job):
+        """Queue a job and return it"""
+        self.jobs = self.active_jobs() + [job]
+        self.executor.submit(job.run)
+        return job
+
+    def active_jobs(self):
+        return [job for job in self.jobs if job.status in (Job.QUEUED, Job.RUNNING)]
+
+    def cancel_all(self):
+        for job in self.active_jobs():
+            job.cancel()
+
+    def shutdown(self, wait=True):
+        """Cancel everything outstanding and stop the executor"""
+        self.cancel_all()
+        self.executor.shutdown(wait=wait)
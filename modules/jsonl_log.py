@@ -0,0 +1,61 @@
+import gzip
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+
+class RotatingJsonlLog:
+    """Append-only JSON Lines log that rotates by size
+
+    Records go to <name>.jsonl in directory. Once it grows past max_bytes it
+    is compressed to <name>-<timestamp>.jsonl.gz and a new file is started;
+    only the newest `backups` archives are kept.
+    """
+    def __init__(self, directory, name='events', max_bytes=5 * 1024 * 1024, backups=10):
+        self.directory = directory
+        self.name = name
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.path = os.path.join(directory, f'{name}.jsonl')
+        self._lock = threading.Lock()
+
+    def write_many(self, records):
+        """Append records (dicts) and rotate if the file got too big"""
+        if not records:
+            return
+        data = ''.join(json.dumps(record, default=str) + '\n' for record in records)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(data)
+                size = f.tell()
+            if size >= self.max_bytes:
+                self._rotate()
+
+    def write(self, record):
+        self.write_many([record])
+
+    def archives(self):
+        """Compressed archives, oldest first"""
+        prefix = f'{self.name}-'
+        return sorted(
+            os.path.join(self.directory, entry)
+            for entry in os.listdir(self.directory)
+            if entry.startswith(prefix) and entry.endswith('.jsonl.gz')
+        )
+
+    def _rotate(self):
+        # Microseconds keep archive names unique and in chronological order
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        archive = os.path.join(self.directory, f'{self.name}-{stamp}.jsonl.gz')
+
+        with open(self.path, 'rb') as src, gzip.open(archive, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(self.path)
+
+        archives = self.archives()
+        for old in archives[:max(len(archives) - self.backups, 0)]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
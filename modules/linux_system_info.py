@@ -0,0 +1,274 @@
+import glob
+import os
+import platform
+import socket
+import time
+from datetime import datetime
+
+import psutil
+
+from modules.disk_probe import DiskProbe
+
+SECURE_BOOT_VAR = '/sys/firmware/efi/efivars/SecureBoot-8be4df61-93ca-11d2-aa0d-00e098032b8c'
+
+def read_file(path, default=''):
+    """Read a small /proc or /sys file, returning default if unreadable"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return default
+
+def read_key_values(path, separator=':'):
+    """Parse 'key: value' lines (e.g. /proc/meminfo, /etc/os-release)"""
+    values = {}
+    for line in read_file(path).split('\n'):
+        if separator in line:
+            key, value = line.split(separator, 1)
+            values[key.strip()] = value.strip().strip('"')
+    return values
+
+class LinuxSystemInfo:
+    """Linux counterpart of MacSystemInfo
+
+    get_all_info() returns the same sections, read straight from /proc and
+    /sys without spawning any process, so a full collection takes
+    milliseconds. Files that need root (serial number, UUID) are left empty
+    when unreadable.
+    """
+    def __init__(self):
+        self.system_info = {}
+
+    def get_all_info(self):
+        """Collect all system information"""
+        self.get_os_info()
+        self.get_hardware_info()
+        self.get_network_info()
+        self.get_storage_info()
+        self.get_battery_info()
+        self.get_bluetooth_info()
+        self.get_security_info()
+        return self.system_info
+
+    def get_os_info(self):
+        """Get detailed OS information"""
+        os_release = read_key_values('/etc/os-release', '=')
+        uname = os.uname()
+        uptime_seconds = float(read_file('/proc/uptime', '0').split()[0])
+        boot_time = time.time() - uptime_seconds
+
+        self.system_info['os'] = {
+            'name': uname.sysname,
+            'release': uname.release,
+            'version': uname.version,
+            'build': os_release.get('BUILD_ID', ''),
+            'product_name': os_release.get('NAME', ''),
+            'product_version': os_release.get('VERSION_ID', ''),
+            'boot_time': datetime.fromtimestamp(boot_time).strftime('%Y-%m-%d %H:%M:%S'),
+            'uptime': self._format_uptime(uptime_seconds)
+        }
+
+    def _format_uptime(self, seconds):
+        days, remainder = divmod(int(seconds), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes = remainder // 60
+        return f"{days} days, {hours}:{minutes:02d}"
+
+    def get_hardware_info(self):
+        """Get detailed hardware information"""
+        processors = []
+        for block in read_file('/proc/cpuinfo').split('\n\n'):
+            entry = {}
+            for line in block.split('\n'):
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    entry[key.strip()] = value.strip()
+            if entry:
+                processors.append(entry)
+
+        first = processors[0] if processors else {}
+        physical_cores = {
+            (entry.get('physical id', '0'), entry.get('core id', entry.get('processor')))
+            for entry in processors
+        }
+        speed = first.get('cpu MHz')
+        mem_total_kb = int(read_key_values('/proc/meminfo').get('MemTotal', '0 kB').split()[0])
+
+        dmi = '/sys/class/dmi/id'
+        self.system_info['hardware'] = {
+            'model_name': read_file(f'{dmi}/product_name'),
+            'model_identifier': ' '.join(filter(None, [
+                read_file(f'{dmi}/sys_vendor'), read_file(f'{dmi}/product_version')
+            ])),
+            # ARM kernels have no "model name"; fall back to the machine type
+            'processor_name': first.get('model name') or first.get('Hardware') or platform.machine(),
+            'processor_speed': f"{float(speed) / 1000:.2f} GHz" if speed else '',
+            'cores': len(physical_cores),
+            'threads': len(processors),
+            'memory': f"{mem_total_kb / (1024**2):.2f} GB",
+            'serial_number': read_file(f'{dmi}/product_serial'),
+            'hardware_uuid': read_file(f'{dmi}/product_uuid'),
+            'bios_version': read_file(f'{dmi}/bios_version')
+        }
+
+    def get_network_info(self):
+        """Get detailed network information"""
+        addresses = psutil.net_if_addrs()
+        interfaces = {}
+        for path in sorted(glob.glob('/sys/class/net/*')):
+            name = os.path.basename(path)
+            interface = {
+                'mac': read_file(f'{path}/address'),
+                'state': read_file(f'{path}/operstate'),
+                'mtu': read_file(f'{path}/mtu'),
+            }
+            # speed is unreadable (EINVAL) while the link is down
+            speed = read_file(f'{path}/speed')
+            if speed and not speed.startswith('-'):
+                interface['speed'] = f"{speed} Mb/s"
+            for addr in addresses.get(name, []):
+                if addr.family == socket.AF_INET:
+                    interface['ipv4'] = addr.address
+            interfaces[name] = interface
+
+        # /proc/net/wireless: "iface: status link level noise ..."
+        wifi = {'interface': '', 'link_quality': '', 'signal_strength': '', 'noise_level': ''}
+        for line in read_file('/proc/net/wireless').split('\n')[2:]:
+            if ':' in line:
+                name, values = line.split(':', 1)
+                fields = values.split()
+                if len(fields) >= 4:
+                    wifi = {
+                        'interface': name.strip(),
+                        'link_quality': fields[1].rstrip('.'),
+                        'signal_strength': fields[2].rstrip('.'),
+                        'noise_level': fields[3].rstrip('.')
+                    }
+                    break
+
+        dns_servers = []
+        for line in read_file('/etc/resolv.conf').split('\n'):
+            fields = line.split()
+            if len(fields) >= 2 and fields[0] == 'nameserver' and fields[1] not in dns_servers:
+                dns_servers.append(fields[1])
+
+        self.system_info['network'] = {
+            'interfaces': interfaces,
+            'wifi': wifi,
+            'dns_servers': dns_servers
+        }
+
+    def get_storage_info(self):
+        """Get detailed storage information"""
+        disks = []
+        for path in sorted(glob.glob('/sys/block/*')):
+            name = os.path.basename(path)
+            if name.startswith(('loop', 'ram', 'zram')):
+                continue
+            sectors = int(read_file(f'{path}/size', '0') or 0)
+            disks.append({
+                'device': f'/dev/{name}',
+                'model': read_file(f'{path}/device/model'),
+                'size': f"{sectors * 512 / (1024**3):.2f} GB",
+                'rotational': read_file(f'{path}/queue/rotational') == '1',
+                'removable': read_file(f'{path}/removable') == '1'
+            })
+
+        volumes = []
+        for mount in DiskProbe().probe():
+            if mount['status'] != 'ok':
+                continue
+            usage = mount['usage']
+            volumes.append({
+                'device': mount['device'],
+                'mountpoint': mount['mountpoint'],
+                'filesystem': mount['fstype'],
+                'total': f"{usage.total / (1024**3):.2f} GB",
+                'used': f"{usage.used / (1024**3):.2f} GB",
+                'free': f"{usage.free / (1024**3):.2f} GB",
+                'percentage': f"{usage.percent}%"
+            })
+
+        self.system_info['storage'] = {'disks': disks, 'volumes': volumes}
+
+    def get_battery_info(self):
+        """Get detailed battery information"""
+        battery_info = {}
+        for path in sorted(glob.glob('/sys/class/power_supply/*')):
+            supply_type = read_file(f'{path}/type')
+            if supply_type == 'Mains':
+                battery_info['power_plugged'] = read_file(f'{path}/online') == '1'
+            elif supply_type == 'Battery' and 'percent' not in battery_info:
+                # Batteries report either energy_* (µWh) or charge_* (µAh)
+                full = read_file(f'{path}/energy_full') or read_file(f'{path}/charge_full')
+                design = read_file(f'{path}/energy_full_design') or read_file(f'{path}/charge_full_design')
+                battery_info.update({
+                    'percent': int(read_file(f'{path}/capacity', '0') or 0),
+                    'status': read_file(f'{path}/status'),
+                    'cycle_count': int(read_file(f'{path}/cycle_count', '0') or 0),
+                    'maximum_capacity': (f"{int(full) * 100 // int(design)}%"
+                                         if full and design and int(design) else ''),
+                    'manufacturer': read_file(f'{path}/manufacturer'),
+                    'model': read_file(f'{path}/model_name'),
+                    'technology': read_file(f'{path}/technology')
+                })
+        self.system_info['battery'] = battery_info
+
+    def get_bluetooth_info(self):
+        """Get detailed Bluetooth information"""
+        controllers = {}
+        for path in sorted(glob.glob('/sys/class/bluetooth/hci*')):
+            name = os.path.basename(path)
+            if ':' in name:
+                # hciX:N entries are connections, not controllers
+                continue
+            uevent = read_key_values(f'{path}/device/uevent', '=')
+            controllers[name] = {
+                'driver': uevent.get('DRIVER', ''),
+                'rfkill_blocked': any(
+                    read_file(f'{rfkill}/soft') == '1' or read_file(f'{rfkill}/hard') == '1'
+                    for rfkill in glob.glob(f'{path}/rfkill*')
+                )
+            }
+
+        # Pairings live under /var/lib/bluetooth/<adapter>/<device>, root only
+        devices = []
+        for info in glob.glob('/var/lib/bluetooth/*/*/info'):
+            values = read_key_values(info, '=')
+            devices.append({
+                'address': os.path.basename(os.path.dirname(info)),
+                'name': values.get('Name', '')
+            })
+
+        self.system_info['bluetooth'] = {
+            'controller': controllers,
+            'paired_devices': devices
+        }
+
+    def get_security_info(self):
+        """Get security-related information"""
+        lsm = read_file('/sys/kernel/security/lsm')
+        selinux = read_file('/sys/fs/selinux/enforce')
+        apparmor = read_file('/sys/module/apparmor/parameters/enabled')
+
+        secure_boot = 'Unknown'
+        try:
+            with open(SECURE_BOOT_VAR, 'rb') as f:
+                secure_boot = 'Enabled' if f.read()[-1:] == b'\x01' else 'Disabled'
+        except OSError:
+            if not os.path.isdir('/sys/firmware/efi'):
+                secure_boot = 'Not supported (legacy BIOS)'
+
+        encrypted = [
+            os.path.basename(os.path.dirname(os.path.dirname(uuid_path)))
+            for uuid_path in glob.glob('/sys/block/dm-*/dm/uuid')
+            if read_file(uuid_path).startswith('CRYPT-')
+        ]
+
+        self.system_info['security'] = {
+            'security_modules': lsm,
+            'selinux': {'1': 'Enforcing', '0': 'Permissive'}.get(selinux, 'Disabled'),
+            'apparmor': 'Enabled' if apparmor == 'Y' else 'Disabled',
+            'secure_boot': secure_boot,
+            'disk_encryption': ', '.join(encrypted) if encrypted else 'None detected'
+        }
@@ -0,0 +1,64 @@
+import time
+
+import psutil
+
+from modules.cpu_sampler import get_sampler
+from modules.ring_buffer import RingBuffer
+
+# Series shown by the live charts: name -> channel labels
+SERIES = {
+    'cpu_total': ('CPU',),
+    'cpu': None,  # One channel per logical core
+    'memory': ('Memory', 'Swap'),
+    'disk': ('Read', 'Write'),
+    'network': ('Sent', 'Received'),
+}
+
+class LiveMetrics:
+    """Recent CPU, memory, disk I/O and network readings for the live charts
+
+    Every call to sample() appends one reading per series to a RingBuffer
+    holding `history` samples, so an hour of 1 Hz data costs a fixed amount
+    of memory however long the window stays open. Disk and network counters
+    are turned into bytes per second between consecutive samples.
+    """
+    def __init__(self, history=3600):
+        self.history = history
+        self.cores = psutil.cpu_count(logical=True) or 1
+        self.buffers = {
+            name: RingBuffer(history, self.cores if labels is None else len(labels))
+            for name, labels in SERIES.items()
+        }
+        self._previous = None
+
+    def labels(self, name):
+        labels = SERIES[name]
+        if labels is None:
+            return tuple(f'Core {core}' for core in range(self.cores))
+        return labels
+
+    def sample(self, now=None):
+        """Read the current values and append them to every buffer"""
+        now = time.time() if now is None else now
+        cores = get_sampler().percent(1, percpu=True)
+        if len(cores) == self.cores:
+            self.buffers['cpu'].append(now, cores)
+            self.buffers['cpu_total'].append(now, (sum(cores) / len(cores),))
+
+        self.buffers['memory'].append(now, (psutil.virtual_memory().percent,
+                                            psutil.swap_memory().percent))
+
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        counters = (
+            (disk.read_bytes, disk.write_bytes) if disk else None,
+            (net.bytes_sent, net.bytes_recv) if net else None,
+        )
+        mono = time.monotonic()
+        if self._previous:
+            old_time, old_counters = self._previous
+            elapsed = mono - old_time
+            for name, new, old in zip(('disk', 'network'), counters, old_counters):
+                if elapsed > 0 and new and old:
+                    self.buffers[name].append(now, [max(0, a - b) / elapsed for a, b in zip(new, old)])
+        self._previous = (mono, counters)
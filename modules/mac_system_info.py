@@ -1,18 +1,54 @@
 import platform
-import subprocess
 import psutil
 import socket
 import uuid
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from modules.command_runner import CommandRunner
+from modules.facts_cache import get_facts_cache
+from modules.system_profiler import HardwareRecord, get_system_profile
+
+AIRPORT = "/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport"
+
 class MacSystemInfo:
+    # Every command the collectors need, keyed by the string they look it up by
+    COMMANDS = {
+        "sw_vers": ['sw_vers'],
+        "uptime": ['uptime'],
+        "ifconfig": ['ifconfig'],
+        f"{AIRPORT} -I": [AIRPORT, '-I'],
+        "scutil --dns": ['scutil', '--dns'],
+        "diskutil list": ['diskutil', 'list'],
+        "csrutil status": ['csrutil', 'status'],
+        "fdesetup status": ['fdesetup', 'status'],
+        "spctl --status": ['spctl', '--status'],
+    }
+    # system_profiler runs separately (see modules.system_profiler); these
+    # should all answer almost at once
+    COMMAND_TIMEOUTS = {}
+    DEFAULT_COMMAND_TIMEOUT = 5
+    # Commands whose output only feeds a cached fact
+    CACHED_COMMANDS = {
+        "sw_vers": 'mac_sw_vers',
+    }
+
     def __init__(self):
         self.system_info = {}
+        self.runner = CommandRunner(timeout=self.DEFAULT_COMMAND_TIMEOUT)
+        self.outputs = {}
+        self.profile = None
         
     def get_all_info(self):
-        """Collect all system information"""
+        """Collect all system information
+
+        All commands are started together up front, so collection takes about
+        as long as the slowest of them. A command that hangs or fails leaves
+        its part of the report empty instead of blocking the rest.
+        """
+        self.prefetch()
         self.get_os_info()
         self.get_hardware_info()
         self.get_network_info()
@@ -22,22 +58,42 @@ class MacSystemInfo:
         self.get_security_info()
         return self.system_info
         
+    def prefetch(self):
+        """Run every collector command concurrently and keep the output"""
+        facts = get_facts_cache()
+        commands = {
+            key: command for key, command in self.COMMANDS.items()
+            if not facts.has(self.CACHED_COMMANDS.get(key, ''))
+        }
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='system-profiler') as executor:
+            # One batched system_profiler run, shared with the dashboard
+            profile = executor.submit(get_system_profile)
+            results = self.runner.run_many(commands, timeouts=self.COMMAND_TIMEOUTS)
+            self.profile = profile.result()
+        self.outputs = {key: result.stdout for key, result in results.items()}
+
     def run_command(self, command):
-        """Safely run a shell command"""
-        try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True)
-            return result.stdout.strip()
-        except Exception as e:
-            return f"Error: {str(e)}"
+        """Safely run a command, without a shell
+
+        Output collected by prefetch() is returned without running the command
+        again. A command that times out yields whatever it printed so far.
+        """
+        if command in self.outputs:
+            return self.outputs[command]
+        result = self.runner.run(
+            self.COMMANDS.get(command, command),
+            timeout=self.COMMAND_TIMEOUTS.get(command)
+        )
+        if result.error and not result.timed_out:
+            return f"Error: {result.error}"
+        return result.stdout
 
     def get_os_info(self):
         """Get detailed OS information"""
-        sw_vers = self.run_command("sw_vers")
-        os_info = {}
-        for line in sw_vers.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                os_info[key.strip()] = value.strip()
+        try:
+            os_info = get_facts_cache().get('mac_sw_vers', self._load_sw_vers)
+        except Exception:
+            os_info = {}
 
         self.system_info['os'] = {
             'name': platform.system(),
@@ -50,30 +106,54 @@ class MacSystemInfo:
             'uptime': self.run_command("uptime")
         }
 
-    def get_hardware_info(self):
-        """Get detailed hardware information"""
-        system_profiler = self.run_command("system_profiler SPHardwareDataType")
-        
-        # Parse system_profiler output
-        hw_info = {}
-        for line in system_profiler.split('\n'):
+    def _load_sw_vers(self):
+        sw_vers = self.run_command("sw_vers")
+        os_info = {}
+        for line in sw_vers.split('\n'):
             if ':' in line:
                 key, value = line.split(':', 1)
-                hw_info[key.strip()] = value.strip()
+                os_info[key.strip()] = value.strip()
+        if not os_info:
+            raise RuntimeError("sw_vers returned no version information")
+        return os_info
+
+    def get_hardware_info(self):
+        """Get detailed hardware information
 
-        self.system_info['hardware'] = {
-            'model_name': hw_info.get('Model Name', ''),
-            'model_identifier': hw_info.get('Model Identifier', ''),
-            'processor_name': hw_info.get('Processor Name', ''),
-            'processor_speed': hw_info.get('Processor Speed', ''),
+        Hardware facts cannot change within a boot, so they are collected once
+        and then served from the persistent facts cache.
+        """
+        try:
+            self.system_info['hardware'] = get_facts_cache().get('mac_hardware', self._load_hardware_info)
+        except Exception:
+            # Nothing usable to cache; report what psutil knows
+            self.system_info['hardware'] = self._hardware_record(HardwareRecord())
+
+    def _load_hardware_info(self):
+        hardware = self._get_profile().hardware
+        if not hardware.model_identifier:
+            raise RuntimeError("system_profiler returned no hardware information")
+        return self._hardware_record(hardware)
+
+    def _hardware_record(self, hardware):
+        return {
+            'model_name': hardware.model_name,
+            'model_identifier': hardware.model_identifier,
+            'processor_name': hardware.processor_name,
+            'processor_speed': hardware.processor_speed,
             'cores': psutil.cpu_count(logical=False),
             'threads': psutil.cpu_count(logical=True),
             'memory': f"{psutil.virtual_memory().total / (1024**3):.2f} GB",
-            'serial_number': hw_info.get('Serial Number (system)', ''),
-            'hardware_uuid': hw_info.get('Hardware UUID', ''),
-            'activation_lock_status': hw_info.get('Activation Lock Status', '')
+            'serial_number': hardware.serial_number,
+            'hardware_uuid': hardware.hardware_uuid,
+            'activation_lock_status': hardware.activation_lock_status
         }
 
+    def _get_profile(self):
+        if self.profile is None:
+            self.profile = get_system_profile()
+        return self.profile
+
     def get_network_info(self):
         """Get detailed network information"""
         network_info = {}
@@ -94,7 +174,7 @@ class MacSystemInfo:
                     interfaces[current_interface]['mac'] = line.split('ether ')[1].split(' ')[0]
 
         # Get Wi-Fi information
-        wifi_info = self.run_command("/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport -I")
+        wifi_info = self.run_command(f"{AIRPORT} -I")
         wifi_data = {}
         for line in wifi_info.split('\n'):
             if ':' in line:
@@ -168,48 +248,19 @@ class MacSystemInfo:
                 }
                 
         # Get more detailed battery info from system_profiler
-        battery_data = self.run_command("system_profiler SPPowerDataType")
-        for line in battery_data.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                battery_info[key.strip()] = value.strip()
+        battery = self._get_profile().battery
+        if battery.present:
+            battery_info.update(battery.as_dict())
 
         self.system_info['battery'] = battery_info
 
     def get_bluetooth_info(self):
         """Get detailed Bluetooth information"""
-        bluetooth_info = {}
-        
-        # Get Bluetooth information from system_profiler
-        bluetooth_data = self.run_command("system_profiler SPBluetoothDataType")
-        
-        # Parse controller info
-        controller_info = {}
-        devices = []
-        current_device = None
-        
-        for line in bluetooth_data.split('\n'):
-            if 'Bluetooth Controller' in line:
-                current_device = "controller"
-            elif ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                if current_device == "controller":
-                    controller_info[key] = value
-                elif current_device == "device":
-                    if key == "Address":
-                        devices.append({'address': value})
-                    elif devices:
-                        devices[-1][key.lower()] = value
-            elif line.strip() and 'Services' not in line:
-                current_device = "device"
-
-        bluetooth_info['controller'] = controller_info
-        bluetooth_info['paired_devices'] = devices
-        
-        self.system_info['bluetooth'] = bluetooth_info
+        bluetooth = self._get_profile().bluetooth
+        self.system_info['bluetooth'] = {
+            'controller': bluetooth.controller_dict() if bluetooth.address else {},
+            'paired_devices': [device.as_dict() for device in bluetooth.devices]
+        }
 
     def get_security_info(self):
         """Get security-related information"""
@@ -0,0 +1,89 @@
+import threading
+
+import psutil
+
+from database.metrics_store import get_metrics_store
+from modules.cpu_sampler import get_sampler
+from modules.system_snapshot import get_disk_snapshot, get_snapshot
+
+def collect_samples(interval=10, previous_net=None, snapshot=None):
+    """Current CPU, memory, disk, network and temperature readings
+
+    Memory and network readings come from `snapshot`, or the shared
+    SystemSnapshot if none is given, and disk usage from the shared
+    DiskSnapshot. Returns ({metric: value}, net_io) where
+    net_io is passed back in as previous_net on the next call to turn the
+    byte counters into rates.
+    """
+    snapshot = snapshot or get_snapshot()
+    samples = {
+        'cpu.percent': get_sampler().percent(window=interval),
+        'memory.percent': snapshot.memory.percent,
+        'swap.percent': snapshot.swap.percent,
+    }
+
+    for mount in get_disk_snapshot().mounts:
+        if mount.status == 'ok':
+            samples[f'disk.percent:{mount.mountpoint}'] = mount.usage.percent
+
+    net = snapshot.net_io
+    now = snapshot.taken_at
+    if previous_net and net:
+        (old_time, old_net) = previous_net
+        elapsed = now - old_time
+        if elapsed > 0:
+            samples['net.sent_bps'] = max(0, net.bytes_sent - old_net.bytes_sent) / elapsed
+            samples['net.recv_bps'] = max(0, net.bytes_recv - old_net.bytes_recv) / elapsed
+
+    if hasattr(psutil, "sensors_temperatures"):
+        try:
+            readings = [entry.current for entries in psutil.sensors_temperatures().values()
+                        for entry in entries if entry.current]
+        except Exception:
+            readings = []
+        if readings:
+            samples['temperature.max'] = max(readings)
+
+    return samples, ((now, net) if net else None)
+
+class MetricsRecorder:
+    """Background thread feeding collect_samples() into the MetricsStore"""
+    def __init__(self, store=None, interval=10):
+        self.store = store or get_metrics_store()
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='metrics-recorder', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        previous_net = None
+        while True:
+            try:
+                samples, previous_net = collect_samples(self.interval, previous_net)
+                self.store.record(samples)
+            except Exception:
+                pass
+            if self._stopped.wait(self.interval):
+                return
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+def get_recorder():
+    """Return the shared, already running MetricsRecorder"""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = MetricsRecorder()
+            _recorder.start()
+        return _recorder
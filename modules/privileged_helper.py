@@ -0,0 +1,276 @@
+import argparse
+import atexit
+import contextlib
+import hmac
+import json
+import os
+import secrets
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from modules.app_paths import APP_NAME
+from modules.command_runner import CommandRunner
+
+# The only things the helper will run as root: operation -> commands
+OPERATIONS = {
+    'purge': [['purge']],
+    'flush_dns': [
+        ['killall', '-HUP', 'mDNSResponder'],
+        ['killall', 'mDNSResponderHelper'],
+    ],
+    'repair_permissions': [['diskutil', 'repairPermissions', '/']],
+}
+
+# Argument that makes main.py (or the frozen app) run the helper server
+HELPER_ARG = '--privileged-helper'
+
+IDLE_TIMEOUT = 600
+OPERATION_TIMEOUT = 300
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves newline-delimited JSON batches on one connection
+
+    Every request line is {"token": ..., "ops": [...]} (or {"token": ...,
+    "shutdown": true}); a result line is streamed back per operation as it
+    finishes, followed by {"done": true}.
+    """
+    def handle(self):
+        server = self.server
+        with server.activity():
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    self._send({'error': 'Malformed request'})
+                    return
+                if not hmac.compare_digest(str(request.get('token', '')), server.token):
+                    self._send({'error': 'Invalid token'})
+                    return
+                if request.get('shutdown'):
+                    self._send({'done': True})
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    return
+                for operation in request.get('ops', []):
+                    self._send(server.run_operation(operation))
+                self._send({'done': True})
+
+    def _send(self, message):
+        self.wfile.write(json.dumps(message).encode() + b'\n')
+        self.wfile.flush()
+
+# Unix domain sockets (and so the helper) do not exist on every platform;
+# the module must still import there, since main.py reads HELPER_ARG from it
+if hasattr(socketserver, 'UnixStreamServer'):
+    class HelperServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Root side of the helper: runs allowlisted operations for one user"""
+        daemon_threads = True
+
+        def __init__(self, path, token, idle_timeout=IDLE_TIMEOUT):
+            super().__init__(path, _Handler)
+            self.token = token
+            self.idle_timeout = idle_timeout
+            self.runner = CommandRunner(timeout=OPERATION_TIMEOUT)
+            self._lock = threading.Lock()
+            self._active = 0
+            self._last_activity = time.monotonic()
+
+        @contextlib.contextmanager
+        def activity(self):
+            """Keep the idle timeout from firing while a client is connected"""
+            with self._lock:
+                self._active += 1
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._last_activity = time.monotonic()
+
+        def idle(self):
+            with self._lock:
+                return not self._active and time.monotonic() - self._last_activity > self.idle_timeout
+
+        def run_operation(self, operation):
+            commands = OPERATIONS.get(operation)
+            if commands is None:
+                return {'op': operation, 'success': False, 'error': 'Operation not allowed'}
+            output = []
+            for command in commands:
+                result = self.runner.run(command)
+                output.append(result.stdout)
+                if result.error or result.returncode != 0:
+                    return {
+                        'op': operation,
+                        'success': False,
+                        'output': '\n'.join(filter(None, output)),
+                        'error': result.error or f'{command[0]} exited with status {result.returncode}'
+                    }
+            return {'op': operation, 'success': True, 'output': '\n'.join(filter(None, output))}
+
+def serve(path, uid, token, idle_timeout=IDLE_TIMEOUT):
+    """Run the helper until told to stop, idle too long, or stdin closes"""
+    # Bind under a temporary name so the client cannot see the socket before
+    # only the requesting user may connect to it
+    pending = f'{path}.pending'
+    server = HelperServer(pending, token, idle_timeout)
+    os.chown(pending, uid, -1)
+    os.chmod(pending, 0o600)
+    os.rename(pending, path)
+
+    def watch_stdin():
+        # The client holds our stdin open for as long as it lives
+        sys.stdin.read()
+        server.shutdown()
+
+    def watch_idle():
+        while True:
+            time.sleep(1)
+            if server.idle():
+                server.shutdown()
+                return
+
+    threading.Thread(target=watch_stdin, daemon=True).start()
+    threading.Thread(target=watch_idle, daemon=True).start()
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pc_repair-helper')
+    parser.add_argument('--socket', required=True)
+    parser.add_argument('--uid', type=int, required=True)
+    parser.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    # The token arrives on stdin so it never shows up in the process list
+    token = sys.stdin.readline().strip()
+    if not token:
+        return 2
+    serve(args.socket, args.uid, token, args.idle_timeout)
+    return 0
+
+class PrivilegedHelper:
+    """Client for a privileged helper started once per session
+
+    The first request spawns `sudo` for the helper server (one password
+    prompt), which then runs batches of OPERATIONS over a Unix socket in a
+    private 0700 directory, authenticated by a random token. Results are
+    streamed back as each operation finishes.
+    """
+    START_TIMEOUT = 120  # Leaves time to answer the password prompt
+
+    def __init__(self, escalate=('sudo', '--')):
+        self.escalate = list(escalate)
+        self.process = None
+        self.directory = None
+        self.socket_path = None
+        self.token = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _helper_command():
+        if getattr(sys, 'frozen', False):
+            return [sys.executable, HELPER_ARG]
+        main_py = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+        return [sys.executable, main_py, HELPER_ARG]
+
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Start the helper unless it is already running"""
+        with self._lock:
+            if self.running():
+                return
+            self._cleanup()
+            self.directory = tempfile.mkdtemp(prefix=f'{APP_NAME}-')
+            self.socket_path = os.path.join(self.directory, 'helper.sock')
+            self.token = secrets.token_hex(32)
+            self.process = subprocess.Popen(
+                self.escalate + self._helper_command() +
+                ['--socket', self.socket_path, '--uid', str(os.getuid())],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL
+            )
+            self.process.stdin.write(self.token.encode() + b'\n')
+            self.process.stdin.flush()
+
+            deadline = time.monotonic() + self.START_TIMEOUT
+            while not os.path.exists(self.socket_path):
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self._cleanup()
+                    raise RuntimeError('Unable to start the privileged helper')
+                time.sleep(0.05)
+
+    def stream(self, operations):
+        """Run a batch of operations, yielding each result as it arrives"""
+        self.start()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.socket_path)
+            connection.sendall(json.dumps({'token': self.token, 'ops': list(operations)}).encode() + b'\n')
+            with connection.makefile('rb') as replies:
+                for line in replies:
+                    reply = json.loads(line)
+                    if reply.get('done'):
+                        return
+                    if 'op' not in reply:
+                        raise RuntimeError(reply.get('error', 'Privileged helper error'))
+                    yield reply
+        raise RuntimeError('Privileged helper closed the connection')
+
+    def run(self, operations):
+        """Run a batch of operations and return all results"""
+        return list(self.stream(operations))
+
+    def stop(self):
+        """Shut the helper down"""
+        with self._lock:
+            if self.running():
+                try:
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                        connection.settimeout(5)
+                        connection.connect(self.socket_path)
+                        connection.sendall(json.dumps({'token': self.token, 'shutdown': True}).encode() + b'\n')
+                        connection.recv(1024)
+                except OSError:
+                    pass
+            self._cleanup()
+
+    def _cleanup(self):
+        if self.process:
+            try:
+                # Closing stdin also stops a helper that missed the shutdown
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self.process = None
+        if self.directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+
+_helper = None
+_helper_lock = threading.Lock()
+
+def get_helper():
+    """Return the shared PrivilegedHelper, stopped automatically at exit"""
+    global _helper
+    with _helper_lock:
+        if _helper is None:
+            _helper = PrivilegedHelper()
+            atexit.register(_helper.stop)
+        return _helper
+
+if __name__ == '__main__':
+    sys.exit(main())
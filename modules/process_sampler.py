@@ -0,0 +1,149 @@
+import heapq
+import threading
+import time
+from collections import namedtuple
+
+import psutil
+
+try:
+    import pwd
+except ImportError:  # Windows
+    pwd = None
+
+# Read together in one oneshot() batch per process. Where POSIX uids exist
+# they are resolved through a cached pwd lookup; elsewhere psutil resolves
+# the user name itself.
+ATTRS = ('pid', 'name', 'uids' if pwd else 'username', 'status', 'create_time',
+         'cpu_times', 'memory_info', 'num_threads')
+
+ProcessInfo = namedtuple('ProcessInfo', (
+    'pid', 'name', 'user', 'status', 'cpu_percent', 'memory_rss', 'memory_percent', 'threads'
+))
+
+class ProcessSampler:
+    """Per-process CPU and memory usage from one pass over the process table
+
+    psutil.process_iter(attrs=...) reads every attribute of a process inside
+    a single oneshot() block, and reuses its Process objects between calls.
+    CPU usage is the change in user + system time since the previous
+    refresh(), keyed by (pid, create_time) so a recycled PID starts over.
+    Each refresh costs one visit per process, with no per-process sleep as
+    in Process.cpu_percent(interval).
+    """
+    def __init__(self):
+        # Reentrant so sample() can hold it across its two refreshes
+        self._lock = threading.RLock()
+        self._cpu_times = {}
+        self._sampled_at = None
+        self._users = {}
+        self.processes = []
+
+    def _user(self, info):
+        if pwd is None:
+            return info.get('username') or ''
+        uids = info.get('uids')
+        if uids is None:
+            return ''
+        uid = uids.real
+        user = self._users.get(uid)
+        if user is None:
+            try:
+                user = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                user = str(uid)
+            self._users[uid] = user
+        return user
+
+    def refresh(self):
+        """Sample every process; returns and stores a list of ProcessInfo"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._sampled_at if self._sampled_at is not None else None
+            total_memory = psutil.virtual_memory().total or 1
+            cpu_times = {}
+            processes = []
+
+            for process in psutil.process_iter(ATTRS):
+                info = process.info
+                times = info['cpu_times']
+                memory = info['memory_info']
+                key = (info['pid'], info['create_time'])
+                cpu_percent = 0.0
+                if times is not None:
+                    used = times.user + times.system
+                    cpu_times[key] = used
+                    previous = self._cpu_times.get(key)
+                    if elapsed and previous is not None:
+                        cpu_percent = round(max(used - previous, 0) / elapsed * 100, 1)
+                rss = memory.rss if memory is not None else 0
+                processes.append(ProcessInfo(
+                    info['pid'], info['name'] or '', self._user(info), info['status'] or '',
+                    cpu_percent, rss, round(rss / total_memory * 100, 1), info['num_threads'] or 0
+                ))
+
+            # Exited processes drop out of the baseline here
+            self._cpu_times = cpu_times
+            self._sampled_at = now
+            self.processes = processes
+            return processes
+
+    def sample(self, interval=0.5, max_age=10):
+        """Refresh with CPU usage averaged over at least `interval` seconds
+
+        Without a baseline, or one older than `max_age` seconds, a new
+        baseline is taken first. The lock is held from the age check to the
+        final refresh, so no other refresh can move the baseline in between.
+        """
+        with self._lock:
+            age = self.age()
+            if age is None or age > max_age:
+                self.refresh()
+                age = 0
+            if age < interval:
+                time.sleep(interval - age)
+            return self.refresh()
+
+    def age(self):
+        """Seconds since the last refresh, or None before the first one"""
+        if self._sampled_at is None:
+            return None
+        return time.monotonic() - self._sampled_at
+
+    def top(self, n=5, key='cpu_percent', processes=None):
+        """The n processes with the largest `key`, by heap selection"""
+        processes = self.processes if processes is None else processes
+        return heapq.nlargest(n, processes, key=lambda process: getattr(process, key))
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+def get_process_sampler():
+    """Return the shared ProcessSampler"""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ProcessSampler()
+        return _sampler
+
+def top_processes(n=5, key='cpu_percent', interval=0.5, max_age=10):
+    """The top n processes by `key` as plain dicts, for findings and reports
+
+    CPU usage is averaged since the previous refresh of the shared sampler.
+    Without a baseline, or one older than `max_age` seconds, a new baseline
+    is taken first, and the sample always covers at least `interval` seconds.
+    """
+    sampler = get_process_sampler()
+    if key == 'cpu_percent':
+        processes = sampler.sample(interval, max_age)
+    else:
+        processes = sampler.refresh()
+    return [
+        {'pid': process.pid, 'name': process.name, 'user': process.user,
+         'cpu_percent': process.cpu_percent, 'memory_percent': process.memory_percent}
+        for process in sampler.top(n, key, processes) if getattr(process, key) > 0
+    ]
+
+def describe_top(processes, key):
+    """'name (pid) 45.0%, ...' for the end of a finding's description"""
+    return ', '.join(f"{process['name']} ({process['pid']}) {process[key]}%" for process in processes)
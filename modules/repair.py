@@ -1,139 +1,227 @@
-import os
-import subprocess
 import platform
-import psutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from database.log_sink import get_log_sink
+from modules.app_paths import cache_dir, log_dir
+from modules.repair_plan import plan_repairs
+from modules.temp_cleaner import TempCleaner
+
+SEVERITY_ORDER = ['low', 'medium', 'high', 'critical']
+
+def _severity_rank(severity):
+    return SEVERITY_ORDER.index(severity) if severity in SEVERITY_ORDER else 1
 
 class SystemRepair:
+    # Directories whose contents the clean_caches action deletes
+    TEMP_DIRS = [
+        '~/Library/Caches',
+        '~/Library/Logs',
+        '/Library/Caches',
+        '/Library/Logs'
+    ]
+
     def __init__(self):
         self.progress = 0
         self.results = []
+        self.cancelled = False
+        # Files and bytes handled so far by the temp file cleanup
+        self.files_processed = 0
+        self.bytes_processed = 0
+        self.progress_callback = None
+        self.result_callback = None
+        self.cleaner = None
+        self.severities = {}
+        self._lock = threading.Lock()
         
-    def fix_issues(self, issues):
-        """Fix the identified issues"""
+    def plan(self, issues):
+        """Return the RepairPlan fix_issues would execute for these issues"""
+        return plan_repairs(issues)
+        
+    def fix_issues(self, issues, dry_run=False, progress_callback=None, result_callback=None):
+        """Fix the identified issues
+
+        The issues are first turned into a RepairPlan, so an action needed by
+        several issues (e.g. purge for both CPU and memory) runs once, and the
+        independent actions of each plan stage run concurrently. With
+        dry_run=True nothing is changed; every action that would run is
+        reported as a result instead. progress_callback(progress, detail) and
+        result_callback(result) stream progress and results to a caller running
+        the repair in the background, and cancel() stops it between actions.
+
+        The cancelled flag is not cleared here: a cancel() that arrives before
+        the job body starts must still stop it. Callers reusing a
+        SystemRepair call reset_cancel() before queueing the next repair.
+        """
         self.progress = 0
         self.results = []
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
         
-        if not issues:
-            self.progress = 100
-            return
+        # Highest severity per issue type, recorded with each action's result
+        self.severities = {}
+        for issue in issues:
+            severity = issue.get('severity', 'medium')
+            current = self.severities.get(issue.get('type'))
+            if current is None or _severity_rank(severity) > _severity_rank(current):
+                self.severities[issue.get('type')] = severity
+        
+        plan = self.plan(issues)
+        if not len(plan):
+            self._set_progress(100)
+            return plan
             
-        progress_per_issue = 100 / len(issues)
+        progress_per_action = 100 / len(plan)
         
-        for issue in issues:
-            try:
-                issue_type = issue.get('type')
-                if issue_type == 'cpu':
-                    self._fix_cpu()
-                elif issue_type == 'memory':
-                    self._fix_memory()
-                elif issue_type == 'disk':
-                    self._fix_disk()
-                elif issue_type == 'network':
-                    self._fix_network()
-                elif issue_type == 'system':
-                    self._fix_system()
-                    
-                self.progress += progress_per_issue
+        for stage in plan.stages:
+            if self.cancelled:
+                break
+            with ThreadPoolExecutor(max_workers=len(stage), thread_name_prefix='repair') as executor:
+                futures = [executor.submit(self._run_action, planned, dry_run) for planned in stage]
+                for future in futures:
+                    future.result()
+                    with self._lock:
+                        progress = self.progress + progress_per_action
+                    self._set_progress(progress)
                 
-            except Exception as e:
-                self.results.append({
-                    'success': False,
-                    'result': f'Error fixing {issue_type} issue: {str(e)}'
-                })
-                
-        self.progress = 100
+        self._set_progress(100)
+        return plan
         
-    def _fix_cpu(self):
-        """Fix CPU-related issues"""
-        if platform.system() == "Darwin":  # macOS
-            try:
-                # Clear CPU-intensive processes
-                subprocess.run(['sudo', 'purge'], check=True)
-                self.results.append({
-                    'success': True,
-                    'result': 'Successfully optimized CPU usage'
-                })
-            except Exception as e:
-                raise Exception(f'Failed to optimize CPU: {str(e)}')
-                
-    def _fix_memory(self):
-        """Fix memory-related issues"""
-        if platform.system() == "Darwin":  # macOS
-            try:
-                # Clear memory cache
-                subprocess.run(['sudo', 'purge'], check=True)
-                self.results.append({
-                    'success': True,
-                    'result': 'Successfully cleared memory cache'
-                })
-            except Exception as e:
-                raise Exception(f'Failed to clear memory: {str(e)}')
-                
-    def _fix_disk(self):
-        """Fix disk-related issues"""
-        if platform.system() == "Darwin":  # macOS
-            try:
-                # Clean temp files
-                temp_dirs = [
-                    '~/Library/Caches',
-                    '~/Library/Logs',
-                    '/Library/Caches',
-                    '/Library/Logs'
-                ]
-                
-                bytes_cleaned = 0
-                for temp_dir in temp_dirs:
-                    dir_path = os.path.expanduser(temp_dir)
-                    if os.path.exists(dir_path):
-                        for root, dirs, files in os.walk(dir_path):
-                            for file in files:
-                                try:
-                                    file_path = os.path.join(root, file)
-                                    bytes_cleaned += os.path.getsize(file_path)
-                                    os.remove(file_path)
-                                except Exception:
-                                    continue
-                                    
-                self.results.append({
-                    'success': True,
-                    'result': f'Cleaned {bytes_cleaned / (1024*1024):.2f} MB of temporary files'
-                })
-            except Exception as e:
-                raise Exception(f'Failed to clean disk: {str(e)}')
-                
-    def _fix_network(self):
-        """Fix network-related issues"""
-        if platform.system() == "Darwin":  # macOS
-            try:
-                # Flush DNS cache
-                subprocess.run(['sudo', 'killall', '-HUP', 'mDNSResponder'], check=True)
-                subprocess.run(['sudo', 'killall', 'mDNSResponderHelper'], check=True)
+    def reset_cancel(self):
+        """Clear a previous cancel() before queueing another repair"""
+        self.cancelled = False
+
+    def cancel(self):
+        """Request the running repair to stop after the current actions"""
+        self.cancelled = True
+        if self.cleaner:
+            self.cleaner.cancel()
+            
+    def _set_progress(self, progress, detail=''):
+        with self._lock:
+            self.progress = progress
+        if self.progress_callback:
+            self.progress_callback(int(progress), detail)
+            
+    def _add_result(self, result):
+        with self._lock:
+            self.results.append(result)
+        if self.result_callback:
+            self.result_callback(result)
+            
+    def _run_action(self, planned, dry_run):
+        """Run (or describe) one planned action, reporting its outcome"""
+        action = planned.action
+        if self.cancelled:
+            return
+        self._set_progress(self.progress, action.description)
+        try:
+            if dry_run:
+                result = {'success': True, 'dry_run': True, 'result': self._describe_action(action)}
+            elif platform.system() != "Darwin":  # macOS only
+                return
+            else:
+                result = {'success': True, 'result': getattr(self, f'_{action.name}')()}
+        except Exception as e:
+            result = {'success': False, 'result': f'Error running {action.name}: {str(e)}'}
+        severities = [self.severities[issue] for issue in planned.issues if issue in self.severities]
+        result.update({
+            'action': action.name,
+            'issues': list(planned.issues),
+            'severity': max(severities, key=_severity_rank) if severities else None
+        })
+        self._add_result(result)
+        if not dry_run:
+            get_log_sink().log_repair(
+                action.name, result['result'],
+                'success' if result['success'] else 'failed', result['severity']
+            )
+        
+    def _describe_action(self, action):
+        """Describe what an action would do"""
+        if platform.system() != "Darwin":
+            return f'No automatic {action.name} action on {platform.system()}'
+        if action.name == 'clean_caches':
+            # Size what the cleanup would reclaim, per directory
+            totals = self._temp_cleaner().scan(self.TEMP_DIRS)
+            reclaimable = ', '.join(
+                f'{path}: {total["bytes"] / (1024*1024):.2f} MB in {total["files"]} files'
+                for path, total in totals.items()
+            )
+            return f'{action.description} ({reclaimable})'
+        return action.description
+        
+    def _run_privileged(self, operation):
+        """Run an allowlisted root operation through the shared privileged helper
+
+        The helper is started (and sudo prompts) once per session, no matter
+        how many actions need root.
+        """
+        from modules.privileged_helper import get_helper
+        result = get_helper().run([operation])[0]
+        if not result['success']:
+            raise Exception(result.get('error') or result.get('output'))
+        
+    def _purge(self):
+        """Free inactive memory, relieving both CPU and memory pressure"""
+        try:
+            self._run_privileged('purge')
+            return 'Successfully purged inactive memory'
+        except Exception as e:
+            raise Exception(f'Failed to purge memory: {str(e)}')
                 
-                self.results.append({
-                    'success': True,
-                    'result': 'Successfully reset network settings'
-                })
-            except Exception as e:
-                raise Exception(f'Failed to fix network: {str(e)}')
+    def _clean_caches(self):
+        """Delete temporary files"""
+        try:
+            totals = self._temp_cleaner().clean(self.TEMP_DIRS)
+            bytes_cleaned = sum(total['bytes'] for total in totals.values())
+            files_cleaned = sum(total['files'] for total in totals.values())
+            return (f'Cleaned {bytes_cleaned / (1024*1024):.2f} MB of temporary files '
+                    f'({files_cleaned} files)')
+        except Exception as e:
+            raise Exception(f'Failed to clean disk: {str(e)}')
+
+    def _temp_cleaner(self):
+        self.files_processed = 0
+        self.bytes_processed = 0
+        # The app keeps its own caches and event logs under the cleaned
+        # directories; deleting them would erase the audit log of this repair
+        self.cleaner = TempCleaner(progress_callback=self._update_cleaner_progress,
+                                   exclude=(cache_dir(), log_dir()))
+        return self.cleaner
+
+    def _update_cleaner_progress(self, files, bytes_processed):
+        self.files_processed = files
+        self.bytes_processed = bytes_processed
+        self._set_progress(
+            self.progress,
+            f'{files} files, {bytes_processed / (1024*1024):.1f} MB processed'
+        )
                 
-    def _fix_system(self):
-        """Fix system-related issues"""
-        if platform.system() == "Darwin":  # macOS
-            try:
-                # Repair disk permissions
-                subprocess.run(['sudo', 'diskutil', 'repairPermissions', '/'], check=True)
+    def _flush_dns(self):
+        """Flush the DNS cache"""
+        try:
+            self._run_privileged('flush_dns')
+            return 'Successfully reset network settings'
+        except Exception as e:
+            raise Exception(f'Failed to fix network: {str(e)}')
                 
-                self.results.append({
-                    'success': True,
-                    'result': 'Successfully repaired system permissions'
-                })
-            except Exception as e:
-                raise Exception(f'Failed to repair system: {str(e)}')
+    def _repair_permissions(self):
+        """Repair disk permissions"""
+        try:
+            self._run_privileged('repair_permissions')
+            return 'Successfully repaired system permissions'
+        except Exception as e:
+            raise Exception(f'Failed to repair system: {str(e)}')
                 
     def get_progress(self):
         """Get the current progress"""
         return int(self.progress)
         
+    def get_cleanup_progress(self):
+        """Get the files and bytes processed by the temp file cleanup"""
+        return self.files_processed, self.bytes_processed
+        
     def get_results(self):
         """Get the repair results"""
         return self.results
\ No newline at end of file
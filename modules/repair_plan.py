@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+
+@dataclass(frozen=True)
+class RepairAction:
+    """One repair step, shared by every issue type that needs it"""
+    name: str
+    description: str
+    # Actions that must finish first when they are part of the same plan
+    after: tuple = ()
+
+ACTIONS = {
+    'purge': RepairAction(
+        'purge', 'Run "sudo purge" to free inactive memory and relieve CPU pressure'),
+    'clean_caches': RepairAction(
+        'clean_caches', 'Delete temporary files from ~/Library/Caches, ~/Library/Logs, '
+                        '/Library/Caches and /Library/Logs'),
+    'flush_dns': RepairAction(
+        'flush_dns', 'Flush the DNS cache by restarting mDNSResponder'),
+    'repair_permissions': RepairAction(
+        'repair_permissions', 'Run "sudo diskutil repairPermissions /"',
+        after=('clean_caches',)),
+}
+
+# Actions each issue type calls for
+ISSUE_ACTIONS = {
+    'cpu': ('purge',),
+    'memory': ('purge',),
+    'disk': ('clean_caches',),
+    'network': ('flush_dns',),
+    'system': ('repair_permissions',),
+}
+
+@dataclass
+class PlannedAction:
+    action: RepairAction
+    # Issue types this action fixes
+    issues: list = field(default_factory=list)
+
+    def as_dict(self):
+        return {
+            'action': self.action.name,
+            'description': self.action.description,
+            'issues': list(self.issues),
+            'after': list(self.action.after)
+        }
+
+class RepairPlan:
+    """Deduplicated, dependency-ordered set of repair actions
+
+    stages is a list of lists of PlannedAction: actions within a stage are
+    independent of each other and may run concurrently, and every stage only
+    starts once the previous one has finished.
+    """
+    def __init__(self, stages=None, unfixable=None):
+        self.stages = stages or []
+        # Issue types no action exists for
+        self.unfixable = unfixable or []
+
+    def actions(self):
+        return [planned for stage in self.stages for planned in stage]
+
+    def __len__(self):
+        return len(self.actions())
+
+    def as_dict(self):
+        return {
+            'stages': [[planned.as_dict() for planned in stage] for stage in self.stages],
+            'unfixable': list(self.unfixable)
+        }
+
+    def describe(self):
+        """Human readable lines, one per action, grouped by stage"""
+        lines = []
+        for number, stage in enumerate(self.stages, 1):
+            for planned in stage:
+                lines.append(f'{number}. {planned.action.description} '
+                             f'(fixes: {", ".join(planned.issues)})')
+        return lines
+
+def plan_repairs(issues, actions=ACTIONS, issue_actions=ISSUE_ACTIONS):
+    """Turn an issue list into a RepairPlan
+
+    Issues mapping to the same action are coalesced into one step. An
+    action's `after` only orders it behind actions that are already in the
+    plan; it never pulls in extra work.
+    """
+    planned = {}
+    unfixable = []
+    for issue in issues:
+        issue_type = issue.get('type')
+        names = issue_actions.get(issue_type)
+        if not names:
+            if issue_type not in unfixable:
+                unfixable.append(issue_type)
+            continue
+        for name in names:
+            entry = planned.setdefault(name, PlannedAction(actions[name]))
+            if issue_type not in entry.issues:
+                entry.issues.append(issue_type)
+
+    # Kahn's algorithm, one stage per dependency level
+    remaining = dict(planned)
+    done = set()
+    stages = []
+    while remaining:
+        ready = [name for name, entry in remaining.items()
+                 if all(dep in done or dep not in planned for dep in entry.action.after)]
+        if not ready:
+            raise ValueError(f'Circular repair dependencies: {", ".join(remaining)}')
+        stages.append([remaining.pop(name) for name in ready])
+        done.update(ready)
+
+    return RepairPlan(stages, unfixable)
@@ -0,0 +1,65 @@
+from array import array
+
+class RingBuffer:
+    """Fixed-size history of float samples, one or more channels wide
+
+    Every channel is a flat array('d') of twice the capacity and each value
+    is written twice, at i and i + capacity. The newest `capacity` values are
+    therefore always one contiguous slice, which window() hands out as a
+    memoryview: readers never copy, never wrap around, and memory stays at
+    16 bytes per sample and channel however long the buffer runs.
+    """
+    def __init__(self, capacity, channels=1):
+        if capacity < 1 or channels < 1:
+            raise ValueError('RingBuffer needs a capacity and at least one channel')
+        self.capacity = capacity
+        self.channels = channels
+        self.times = array('d', bytes(16 * capacity))
+        self.data = [array('d', bytes(16 * capacity)) for _ in range(channels)]
+        self.head = 0  # Next slot to write, in [0, capacity)
+        self.count = 0
+        self.total = 0  # Samples appended since creation or clear()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, timestamp, values):
+        """Add one sample; `values` holds one float per channel"""
+        if len(values) != self.channels:
+            raise ValueError(f'Expected {self.channels} values, got {len(values)}')
+        i = self.head
+        j = i + self.capacity
+        self.times[i] = self.times[j] = timestamp
+        for channel, value in zip(self.data, values):
+            channel[i] = channel[j] = value
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.total += 1
+
+    def _start(self, count):
+        # The last `count` values end right before head + capacity
+        return self.head + self.capacity - count
+
+    def window(self, channel=0, count=None):
+        """The last `count` values of a channel, oldest first, without copying"""
+        count = self.count if count is None else min(count, self.count)
+        start = self._start(count)
+        return memoryview(self.data[channel])[start:start + count]
+
+    def time_window(self, count=None):
+        """Timestamps matching window(count)"""
+        count = self.count if count is None else min(count, self.count)
+        start = self._start(count)
+        return memoryview(self.times)[start:start + count]
+
+    def latest(self, channel=0):
+        """Newest value of a channel, or None while the buffer is empty"""
+        if not self.count:
+            return None
+        return self.data[channel][self.head + self.capacity - 1]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.total = 0
@@ -1,112 +1,245 @@
-import psutil
 import platform
-import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from database.log_sink import get_log_sink
+from modules.process_sampler import describe_top, top_processes
+from modules.system_snapshot import get_disk_snapshot, get_snapshot
 
 class SystemScanner:
-    def __init__(self):
+    # Seconds each check may run before it is reported as timed out
+    CHECK_TIMEOUTS = {
+        'cpu': 3,
+        'memory': 2,
+        'disk': 10,
+        'network': 5,
+        'system': 2,
+    }
+    DEFAULT_CHECK_TIMEOUT = 5
+    # Processes named in a high CPU or memory finding
+    TOP_PROCESSES = 5
+
+    def __init__(self, concurrent=False):
         self.progress = 0
         self.results = []
-        
-    def start_scan(self):
-        """Start the system scan"""
+        self.cancelled = False
+        self.concurrent = concurrent
+        self.snapshot = None
+
+    def start_scan(self, progress_callback=None, result_callback=None):
+        """Start the system scan
+
+        progress_callback(progress, check_name) is called after every check
+        and result_callback(result) for every finding, so a caller running the
+        scan on a worker thread can stream both back to the UI. The checks
+        evaluate their thresholds against one shared SystemSnapshot, taken
+        (or reused, if recent) by the first check that needs it. Only the
+        disk check waits for the DiskSnapshot, within its own deadline.
+        """
         self.progress = 0
         self.results = []
-        
+        self.cancelled = False
+        self.snapshot = None
+
+        checks = [
+            ('cpu', self._check_cpu),
+            ('memory', self._check_memory),
+            ('disk', self._check_disk),
+            ('network', self._check_network),
+            ('system', self._check_system),
+        ]
+
         try:
-            # Check CPU
-            self._check_cpu()
-            self.progress = 20
-            
-            # Check Memory
-            self._check_memory()
-            self.progress = 40
-            
-            # Check Disk
-            self._check_disk()
-            self.progress = 60
-            
-            # Check Network
-            self._check_network()
-            self.progress = 80
-            
-            # Check System
-            self._check_system()
-            self.progress = 100
-            
+            if self.concurrent:
+                self._run_concurrent(checks, progress_callback, result_callback)
+            else:
+                self._run_sequential(checks, progress_callback, result_callback)
+
         except Exception as e:
-            self.results.append({
+            self._report(len(checks), len(checks), 'error', [{
                 'type': 'error',
                 'severity': 'high',
                 'description': f'Error during scan: {str(e)}'
-            })
-            self.progress = 100
-            
+            }], None, result_callback)
+
+        self.progress = 100
+
+    def cancel(self):
+        """Request the running scan to stop after the current check"""
+        self.cancelled = True
+
+    def _run_sequential(self, checks, progress_callback, result_callback):
+        """Run the checks one after another"""
+        for index, (name, check) in enumerate(checks):
+            if self.cancelled:
+                break
+            self._report(index + 1, len(checks), name, check(),
+                         progress_callback, result_callback)
+
+    def _run_concurrent(self, checks, progress_callback, result_callback):
+        """Run all checks in a thread pool, each bounded by its own timeout
+
+        Wall time is roughly that of the slowest check. A check that misses its
+        deadline is reported as a timeout and its thread is abandoned, so it can
+        no longer stall the scan.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix='scan')
+        started = time.monotonic()
+        futures = {executor.submit(check): name for name, check in checks}
+        deadlines = {
+            future: started + self.CHECK_TIMEOUTS.get(name, self.DEFAULT_CHECK_TIMEOUT)
+            for future, name in futures.items()
+        }
+        pending = set(futures)
+        completed = 0
+
+        try:
+            while pending and not self.cancelled:
+                # Wake up at least every 100ms so cancellation stays responsive
+                next_deadline = min(deadlines[future] for future in pending)
+                timeout = min(max(next_deadline - time.monotonic(), 0), 0.1)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = futures[future]
+                    try:
+                        found = future.result()
+                    except Exception as e:
+                        found = [{
+                            'type': name,
+                            'severity': 'low',
+                            'description': f'{name.capitalize()} check failed: {str(e)}'
+                        }]
+                    completed += 1
+                    self._report(completed, len(checks), name, found,
+                                 progress_callback, result_callback)
+
+                now = time.monotonic()
+                for future in [f for f in pending if now >= deadlines[f]]:
+                    pending.discard(future)
+                    name = futures[future]
+                    completed += 1
+                    self._report(completed, len(checks), name, [{
+                        'type': 'timeout',
+                        'severity': 'low',
+                        'description': f'{name.capitalize()} check timed out after '
+                                       f'{self.CHECK_TIMEOUTS.get(name, self.DEFAULT_CHECK_TIMEOUT)}s'
+                    }], progress_callback, result_callback)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _report(self, completed, total, name, found, progress_callback, result_callback):
+        """Record the findings of a finished check and publish progress"""
+        for result in found or []:
+            self.results.append(result)
+            get_log_sink().log_scan_result(result)
+            if result_callback:
+                result_callback(result)
+
+        self.progress = int(completed * 100 / total)
+        if progress_callback:
+            progress_callback(self.progress, name)
+
+    def _snapshot(self):
+        """The snapshot of the running scan, taken by the first check that needs it"""
+        if self.snapshot is None:
+            self.snapshot = get_snapshot()
+        return self.snapshot
+
     def _check_cpu(self):
         """Check CPU status"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        issues = []
+        cpu_percent = self._snapshot().cpu_percent
         if cpu_percent > 70:
-            self.results.append({
+            processes = top_processes(self.TOP_PROCESSES, 'cpu_percent')
+            issues.append({
                 'type': 'cpu',
                 'severity': 'high',
-                'description': f'High CPU usage detected: {cpu_percent}%'
+                'description': f'High CPU usage detected: {cpu_percent}% '
+                               f'(top: {describe_top(processes, "cpu_percent")})',
+                'processes': processes
             })
-            
+        return issues
+
     def _check_memory(self):
         """Check memory status"""
-        memory = psutil.virtual_memory()
+        issues = []
+        memory = self._snapshot().memory
         if memory.percent > 80:
-            self.results.append({
+            processes = top_processes(self.TOP_PROCESSES, 'memory_percent')
+            issues.append({
                 'type': 'memory',
                 'severity': 'high',
-                'description': f'High memory usage: {memory.percent}%'
+                'description': f'High memory usage: {memory.percent}% '
+                               f'(top: {describe_top(processes, "memory_percent")})',
+                'processes': processes
             })
-            
+        return issues
+
     def _check_disk(self):
         """Check disk space"""
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                if usage.percent > 85:
-                    self.results.append({
-                        'type': 'disk',
-                        'severity': 'medium',
-                        'description': f'Low disk space on {partition.mountpoint}: {usage.percent}%'
-                    })
-            except Exception:
-                continue
-                
+        issues = []
+        for mount in get_disk_snapshot().mounts:
+            if mount.status == 'timeout':
+                issues.append({
+                    'type': 'mount',
+                    'severity': 'medium',
+                    'description': f'Mount {mount.mountpoint} ({mount.fstype}) is not responding'
+                })
+            elif mount.status == 'ok' and mount.usage.percent > 85:
+                issues.append({
+                    'type': 'disk',
+                    'severity': 'medium',
+                    'description': f'Low disk space on {mount.mountpoint}: {mount.usage.percent}%'
+                })
+        return issues
+
     def _check_network(self):
         """Check network status"""
+        issues = []
         try:
             if platform.system() == "Darwin":  # macOS
-                result = os.system("ping -c 1 8.8.8.8")
-                if result != 0:
-                    self.results.append({
+                result = subprocess.run(
+                    ['ping', '-c', '1', '8.8.8.8'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=self.CHECK_TIMEOUTS['network']
+                )
+                if result.returncode != 0:
+                    issues.append({
                         'type': 'network',
                         'severity': 'medium',
                         'description': 'Network connectivity issues detected'
                     })
+        except subprocess.TimeoutExpired:
+            issues.append({
+                'type': 'network',
+                'severity': 'medium',
+                'description': 'Network connectivity issues detected'
+            })
         except Exception:
             pass
-            
+        return issues
+
     def _check_system(self):
         """Check system status"""
+        issues = []
         try:
-            boot_time = psutil.boot_time()
-            uptime = psutil.time.time() - boot_time
-            if uptime > 30 * 24 * 3600:  # 30 days
-                self.results.append({
+            if self._snapshot().uptime > 30 * 24 * 3600:  # 30 days
+                issues.append({
                     'type': 'system',
                     'severity': 'low',
                     'description': 'System has not been restarted in over 30 days'
                 })
         except Exception:
             pass
-            
+        return issues
+
     def get_progress(self):
         """Get the current progress"""
         return self.progress
-        
+
     def get_results(self):
         """Get the scan results"""
-        return self.results
\ No newline at end of file
+        return self.results
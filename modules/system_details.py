@@ -0,0 +1,195 @@
+import platform
+import socket
+import subprocess
+
+import psutil
+
+from modules.cpu_sampler import get_sampler
+from modules.facts_cache import get_facts_cache
+from modules.linux_system_info import LinuxSystemInfo
+from modules.system_profiler import get_system_profile
+from modules.system_snapshot import get_disk_snapshot, get_snapshot
+
+def format_bytes(bytes):
+    gb = bytes / (1024 ** 3)
+    return f"{gb:.2f} GB"
+
+class SystemDetailsCollector:
+    """Gathers the System Details panel contents one section at a time
+
+    Each section has its own collector so a caller can run them in the
+    background and show every section as soon as its collector finishes.
+    Facts that cannot change within a boot come from the persistent facts
+    cache, and the static sections can be skipped on periodic refreshes.
+    CPU, memory and storage readings come from the shared System- and
+    DiskSnapshot that scans and diagnostics also use.
+    """
+    STATIC_SECTIONS = ("System", "macOS Details", "Linux Details")
+
+    def __init__(self):
+        self.cpu_sampler = get_sampler()
+        self.facts = get_facts_cache()
+
+    def sections(self, dynamic_only=False):
+        """Ordered (section name, collector) pairs for this platform
+
+        With dynamic_only=True the sections that never change within a boot
+        are left out.
+        """
+        sections = [
+            ("System", self.collect_system),
+            ("CPU", self.collect_cpu),
+            ("Memory", self.collect_memory),
+            ("Storage", self.collect_storage),
+            ("Network", self.collect_network),
+        ]
+        if platform.system() == "Darwin":
+            sections.append(("macOS Details", self.collect_macos))
+        elif platform.system() == "Linux":
+            sections.append(("Linux Details", self.collect_linux))
+        if dynamic_only:
+            sections = [(name, collector) for name, collector in sections
+                        if name not in self.STATIC_SECTIONS]
+        return sections
+
+    def section_names(self):
+        return [name for name, collector in self.sections()]
+
+    def get_system_info(self):
+        """Get detailed system information"""
+        return {name: collector() for name, collector in self.sections()}
+
+    def collect_system(self):
+        return self.facts.get('system', lambda: {
+            "Operating System": f"{platform.system()} {platform.release()}",
+            "Version": platform.version(),
+            "Machine": platform.machine(),
+            "Processor": platform.processor(),
+            "Hostname": socket.gethostname()
+        })
+
+    def collect_cpu(self):
+        cores = self.facts.get('cpu_cores', lambda: {
+            "Physical Cores": psutil.cpu_count(logical=False),
+            "Total Cores": psutil.cpu_count(logical=True)
+        })
+
+        cpu_freq = psutil.cpu_freq()
+        if cpu_freq:
+            cpu_speed = f"{cpu_freq.current/1000:.2f} GHz"
+        else:
+            cpu_speed = "Unknown"
+
+        return dict(cores, **{
+            "Current Speed": cpu_speed,
+            "Current Usage": f"{get_snapshot().cpu_percent}%",
+            "Average (10s)": f"{self.cpu_sampler.percent(10)}%",
+            "Average (60s)": f"{self.cpu_sampler.percent(60)}%"
+        })
+
+    def collect_memory(self):
+        snapshot = get_snapshot()
+        mem = snapshot.memory
+        swap = snapshot.swap
+        return {
+            "Total RAM": format_bytes(mem.total),
+            "Used RAM": format_bytes(mem.used),
+            "Available RAM": format_bytes(mem.available),
+            "RAM Usage": f"{mem.percent}%",
+            "Total Swap": format_bytes(swap.total),
+            "Used Swap": format_bytes(swap.used),
+            "Swap Usage": f"{swap.percent}%"
+        }
+
+    def collect_storage(self):
+        storage_info = {}
+        for mount in get_disk_snapshot().mounts:
+            if mount.status == 'timeout':
+                storage_info[f"Drive {mount.mountpoint}"] = {"Status": "Not responding"}
+            elif mount.status == 'ok':
+                usage = mount.usage
+                storage_info[f"Drive {mount.mountpoint}"] = {
+                    "Total": format_bytes(usage.total),
+                    "Used": format_bytes(usage.used),
+                    "Free": format_bytes(usage.free),
+                    "Usage": f"{usage.percent}%"
+                }
+        return storage_info
+
+    def collect_network(self):
+        network_info = {}
+        try:
+            # Get primary IP address
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.connect(("8.8.8.8", 80))
+            network_info["IP Address"] = s.getsockname()[0]
+            s.close()
+        except Exception:
+            network_info["IP Address"] = "Not available"
+
+        # Get network interfaces
+        for interface, addrs in psutil.net_if_addrs().items():
+            for addr in addrs:
+                if addr.family == socket.AF_INET:
+                    network_info[f"Interface {interface}"] = addr.address
+        return network_info
+
+    def collect_macos(self):
+        try:
+            return self.facts.get('macos_details', self._load_macos_details)
+        except Exception:
+            return {"Note": "Additional macOS details unavailable"}
+
+    def collect_linux(self):
+        return self.facts.get('linux_details', self._load_linux_details)
+
+    def _load_linux_details(self):
+        linux = LinuxSystemInfo()
+        linux.get_os_info()
+        linux.get_hardware_info()
+        linux.get_security_info()
+        os_info = linux.system_info['os']
+        hardware = linux.system_info['hardware']
+        security = linux.system_info['security']
+
+        details = {
+            "Distribution": f"{os_info['product_name']} {os_info['product_version']}".strip(),
+            "Kernel": os_info['release'],
+            "Model Name": hardware['model_name'],
+            "Vendor": hardware['model_identifier'],
+            "Processor Name": hardware['processor_name'],
+            "Serial Number": hardware['serial_number'],
+            "BIOS Version": hardware['bios_version'],
+            "Secure Boot": security['secure_boot'],
+            "Security Modules": security['security_modules']
+        }
+        return {key: value for key, value in details.items() if value}
+
+    def _load_macos_details(self):
+        # Get macOS version info
+        output = subprocess.check_output(['sw_vers']).decode()
+        mac_info = {}
+        for line in output.split('\n'):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                mac_info[key.strip()] = value.strip()
+
+        # Get System Hardware Info from the shared system_profiler run
+        hardware = get_system_profile().hardware
+        if not hardware.model_identifier:
+            raise RuntimeError("system_profiler returned no hardware information")
+        details = {
+            "Model Name": hardware.model_name,
+            "Model Identifier": hardware.model_identifier,
+            "Processor Name": hardware.processor_name,
+            "Processor Speed": hardware.processor_speed,
+            "Number of Processors": hardware.number_of_processors,
+            "Total Number of Cores": hardware.total_cores,
+            "Memory": hardware.memory,
+            "Serial Number (system)": hardware.serial_number,
+            "Hardware UUID": hardware.hardware_uuid,
+            "Activation Lock Status": hardware.activation_lock_status
+        }
+        mac_info.update((key, value) for key, value in details.items() if value)
+
+        return mac_info
@@ -0,0 +1,154 @@
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta
+
+from modules.app_paths import cache_dir
+
+LogSummary = namedtuple('LogSummary', 'errors subsystems since until stopped_early timed_out')
+
+def parse_timestamp(text):
+    """Parse a `log show` timestamp such as '2024-05-01 10:00:00.123456-0700'"""
+    return datetime.strptime(text, '%Y-%m-%d %H:%M:%S.%f%z')
+
+class SystemLogReader:
+    """Streams error and fault entries from the macOS unified log
+
+    `log show --style ndjson` is read from the pipe one entry at a time and
+    only a per-subsystem count is kept, so memory stays flat however busy
+    the log is. Reading stops, and `log` is killed, after `stop_after`
+    entries or `timeout` seconds. The timestamp of the newest entry seen is
+    kept in the cache directory, and the next read starts there, so
+    repeated diagnostics only read what was logged in between. Without a
+    cursor, or with one older than `max_age` seconds, the last `max_age`
+    seconds are read.
+    """
+    PREDICATE = 'messageType == error OR messageType == fault'
+
+    def __init__(self, cursor_path=None, max_age=3600, stop_after=500, timeout=30):
+        if cursor_path is None:
+            try:
+                cursor_path = os.path.join(cache_dir(), 'system_log_cursor.json')
+            except OSError:
+                # No writable cache directory; every read starts from max_age
+                cursor_path = None
+        self.cursor_path = cursor_path
+        self.max_age = max_age
+        self.stop_after = stop_after
+        self.timeout = timeout
+
+    def read(self, now=None):
+        """Count new error entries by subsystem and return a LogSummary"""
+        now = now or datetime.now().astimezone()
+        cursor = self.load_cursor()
+        # A cursor in the future (the clock was set back) is as good as none
+        if cursor is None or not timedelta(0) <= now - cursor <= timedelta(seconds=self.max_age):
+            cursor = None
+            since = now - timedelta(seconds=self.max_age)
+        else:
+            since = cursor
+        command = ['log', 'show', '--style', 'ndjson', '--start', f'{since:%Y-%m-%d %H:%M:%S%z}',
+                   '--predicate', self.PREDICATE]
+
+        subsystems = Counter()
+        errors = 0
+        newest = None
+        stopped_early = False
+        with self._stream(command) as (entries, timed_out):
+            for entry in entries:
+                timestamp = entry.get('timestamp')
+                if not timestamp:
+                    # The closing {"count": ..., "finished": 1} line
+                    continue
+                try:
+                    logged_at = parse_timestamp(timestamp)
+                except ValueError:
+                    continue
+                # --start has one-second resolution; skip what the last read saw
+                if cursor is not None and logged_at <= cursor:
+                    continue
+                subsystem = entry.get('subsystem') or os.path.basename(entry.get('processImagePath') or '')
+                subsystems[subsystem or '(unknown)'] += 1
+                errors += 1
+                newest = logged_at
+                if errors >= self.stop_after:
+                    stopped_early = True
+                    break
+
+        if newest is not None:
+            self.save_cursor(newest)
+        return LogSummary(errors, subsystems, since, newest, stopped_early, timed_out.is_set())
+
+    def _stream(self, command):
+        return _LogStream(command, self.timeout)
+
+    def load_cursor(self):
+        if not self.cursor_path:
+            return None
+        try:
+            with open(self.cursor_path) as f:
+                return parse_timestamp(json.load(f)['timestamp'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save_cursor(self, timestamp):
+        if not self.cursor_path:
+            return
+        try:
+            # Write atomically so a concurrent reader never sees half a file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cursor_path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S.%f%z')}, f)
+            os.replace(tmp_path, self.cursor_path)
+        except OSError:
+            pass
+
+class _LogStream:
+    """Context manager yielding (entries, timed_out) for a running command
+
+    entries iterates the decoded JSON lines of its output. The command is
+    killed after `timeout` seconds, or on exit if it is still running, which
+    is what ends a read that stopped early.
+    """
+    def __init__(self, command, timeout):
+        self.command = command
+        self.timeout = timeout
+        self.timed_out = threading.Event()
+        self.process = None
+        self.timer = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.timer = threading.Timer(self.timeout, self._expire)
+        self.timer.daemon = True
+        self.timer.start()
+        return self._entries(), self.timed_out
+
+    def _expire(self):
+        self.timed_out.set()
+        self.process.kill()
+
+    def _entries(self):
+        for line in self.process.stdout:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                yield entry
+
+    def __exit__(self, *exc_info):
+        self.timer.cancel()
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.stdout.close()
+        self.process.wait()
+        return False
@@ -0,0 +1,222 @@
+import json
+import os
+import platform
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+
+from modules.command_runner import CommandRunner
+
+# Every data type the tool needs, requested in a single system_profiler run
+DATA_TYPES = ('SPHardwareDataType', 'SPPowerDataType', 'SPBluetoothDataType')
+
+# Path to recorded `system_profiler -json` output to parse instead of running
+# the command, e.g. to drive the parser on Linux
+FIXTURE_ENV = 'PC_REPAIR_SYSTEM_PROFILER_FIXTURE'
+
+@dataclass(frozen=True)
+class HardwareRecord:
+    model_name: str = ''
+    model_identifier: str = ''
+    processor_name: str = ''
+    processor_speed: str = ''
+    number_of_processors: int = 0
+    total_cores: int = 0
+    memory: str = ''
+    serial_number: str = ''
+    hardware_uuid: str = ''
+    activation_lock_status: str = ''
+
+    def as_dict(self):
+        return asdict(self)
+
+@dataclass(frozen=True)
+class BatteryRecord:
+    present: bool = False
+    charge_percent: int = 0
+    charging: bool = False
+    fully_charged: bool = False
+    cycle_count: int = 0
+    condition: str = ''
+    maximum_capacity: str = ''
+    charger_connected: bool = False
+    charger_watts: str = ''
+
+    def as_dict(self):
+        return asdict(self)
+
+@dataclass(frozen=True)
+class BluetoothDevice:
+    name: str = ''
+    address: str = ''
+    connected: bool = False
+    minor_type: str = ''
+
+    def as_dict(self):
+        return asdict(self)
+
+@dataclass(frozen=True)
+class BluetoothRecord:
+    address: str = ''
+    state: str = ''
+    chipset: str = ''
+    firmware_version: str = ''
+    devices: tuple = ()
+
+    def controller_dict(self):
+        return {
+            'address': self.address,
+            'state': self.state,
+            'chipset': self.chipset,
+            'firmware_version': self.firmware_version
+        }
+
+@dataclass(frozen=True)
+class SystemProfile:
+    hardware: HardwareRecord = field(default_factory=HardwareRecord)
+    battery: BatteryRecord = field(default_factory=BatteryRecord)
+    bluetooth: BluetoothRecord = field(default_factory=BluetoothRecord)
+
+def _flag(value):
+    """system_profiler reports booleans as 'TRUE'/'FALSE' or 'Yes'/'No'"""
+    return str(value).strip().lower() in ('true', 'yes', '1')
+
+def _int(value):
+    try:
+        return int(str(value).split()[0].rstrip('%'))
+    except (ValueError, IndexError):
+        return 0
+
+def _attrib(value):
+    """Turn values such as 'attrib_on' or 'activation_lock_disabled' into text"""
+    value = str(value or '')
+    for prefix in ('attrib_', 'activation_lock_'):
+        if value.startswith(prefix):
+            return value[len(prefix):].replace('_', ' ').capitalize()
+    return value
+
+def parse_hardware(items):
+    if not items:
+        return HardwareRecord()
+    hw = items[0]
+
+    # Apple silicon reports "proc 10:8:2" (total:performance:efficiency)
+    cores = hw.get('number_processors', 0)
+    if isinstance(cores, str) and cores.startswith('proc'):
+        total_cores = _int(cores.split()[-1].split(':')[0])
+        processors = 1
+    else:
+        total_cores = _int(cores)
+        processors = _int(hw.get('packages', 1))
+
+    return HardwareRecord(
+        model_name=hw.get('machine_name', ''),
+        model_identifier=hw.get('machine_model', ''),
+        processor_name=hw.get('chip_type') or hw.get('cpu_type', ''),
+        processor_speed=hw.get('current_processor_speed', ''),
+        number_of_processors=processors,
+        total_cores=total_cores,
+        memory=hw.get('physical_memory', ''),
+        serial_number=hw.get('serial_number', ''),
+        hardware_uuid=hw.get('platform_UUID', ''),
+        activation_lock_status=_attrib(hw.get('activation_lock_status', ''))
+    )
+
+def parse_power(items):
+    battery = {}
+    charger = {}
+    for item in items or []:
+        name = item.get('_name', '')
+        if name == 'spbattery_information':
+            battery = item
+        elif name == 'sppower_ac_charger_information':
+            charger = item
+
+    charge = battery.get('sppower_battery_charge_info', {})
+    health = battery.get('sppower_battery_health_info', {})
+    return BatteryRecord(
+        present=bool(battery),
+        charge_percent=_int(charge.get('sppower_battery_state_of_charge', 0)),
+        charging=_flag(charge.get('sppower_battery_is_charging', '')),
+        fully_charged=_flag(charge.get('sppower_battery_fully_charged', '')),
+        cycle_count=_int(health.get('sppower_battery_cycle_count', 0)),
+        condition=health.get('sppower_battery_health', ''),
+        maximum_capacity=health.get('sppower_battery_health_maximum_capacity', ''),
+        charger_connected=_flag(charger.get('sppower_battery_charger_connected', '')),
+        charger_watts=str(charger.get('sppower_ac_charger_watts', ''))
+    )
+
+def parse_bluetooth(items):
+    if not items:
+        return BluetoothRecord()
+    bt = items[0]
+    controller = bt.get('controller_properties', {})
+
+    devices = []
+    for key, connected in (('device_connected', True), ('device_not_connected', False)):
+        for entry in bt.get(key, []):
+            # Each entry is {device name: properties}
+            for name, props in entry.items():
+                devices.append(BluetoothDevice(
+                    name=name,
+                    address=props.get('device_address', ''),
+                    connected=connected,
+                    minor_type=props.get('device_minorType', '')
+                ))
+
+    return BluetoothRecord(
+        address=controller.get('controller_address', ''),
+        state=_attrib(controller.get('controller_state', '')),
+        chipset=controller.get('controller_chipset', ''),
+        firmware_version=controller.get('controller_firmwareVersion', ''),
+        devices=tuple(devices)
+    )
+
+def parse_system_profile(text):
+    """Parse `system_profiler -json` output into a SystemProfile"""
+    try:
+        data = json.loads(text) if text else {}
+    except ValueError:
+        data = {}
+    return SystemProfile(
+        hardware=parse_hardware(data.get('SPHardwareDataType')),
+        battery=parse_power(data.get('SPPowerDataType')),
+        bluetooth=parse_bluetooth(data.get('SPBluetoothDataType'))
+    )
+
+class SystemProfiler:
+    """Runs system_profiler once for all data types and parses the JSON"""
+    TIMEOUT = 30
+
+    def __init__(self, runner=None):
+        self.runner = runner or CommandRunner(timeout=self.TIMEOUT, max_output=16 * 1024 * 1024)
+
+    def read_output(self):
+        fixture = os.environ.get(FIXTURE_ENV)
+        if fixture:
+            with open(fixture) as f:
+                return f.read()
+        if platform.system() != "Darwin":
+            return ''
+        return self.runner.run(['system_profiler', '-json'] + list(DATA_TYPES)).stdout
+
+    def load(self):
+        return parse_system_profile(self.read_output())
+
+
+_profile = None
+_profile_time = 0
+_profile_lock = threading.Lock()
+
+def get_system_profile(max_age=60):
+    """Return the shared SystemProfile
+
+    system_profiler is re-run at most every `max_age` seconds, and concurrent
+    callers wait for and share a single run.
+    """
+    global _profile, _profile_time
+    with _profile_lock:
+        if _profile is None or time.monotonic() - _profile_time > max_age:
+            _profile = SystemProfiler().load()
+            _profile_time = time.monotonic()
+        return _profile
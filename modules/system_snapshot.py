@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+
+import psutil
+
+from modules.cpu_sampler import get_sampler
+from modules.disk_probe import DiskProbe
+
+# One DiskProbe record; usage is a psutil disk_usage result or None
+Mount = namedtuple('Mount', ('device', 'mountpoint', 'fstype', 'status', 'usage', 'error'))
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """System-wide readings taken together at one point in time
+
+    Every field is immutable (psutil results are named tuples), so one
+    snapshot can be handed to any number of threads and checks. Taking one
+    never touches a filesystem; mounts are in a DiskSnapshot of their own.
+    """
+    taken_at: float  # time.time() when the snapshot was taken
+    cpu_percent: float  # Average over the last second, from the CPU sampler
+    cpu_per_core: tuple
+    memory: tuple  # psutil.virtual_memory()
+    swap: tuple  # psutil.swap_memory()
+    net_io: tuple  # psutil.net_io_counters(), or None
+    boot_time: float
+
+    @property
+    def uptime(self):
+        return self.taken_at - self.boot_time
+
+    def age(self):
+        return time.time() - self.taken_at
+
+@dataclass(frozen=True)
+class DiskSnapshot:
+    """Usage of every mounted filesystem, from one DiskProbe pass
+
+    Kept apart from SystemSnapshot because probing can take up to the
+    per-mount timeout, and only disk checks should wait for that.
+    """
+    taken_at: float
+    mounts: tuple  # Mount records
+
+    def age(self):
+        return time.time() - self.taken_at
+
+    def mount(self, mountpoint):
+        """The Mount record for `mountpoint`, or None if it was not probed"""
+        for mount in self.mounts:
+            if mount.mountpoint == mountpoint:
+                return mount
+        return None
+
+class SnapshotCollector:
+    """Takes System- and DiskSnapshots and reuses each for `ttl` seconds
+
+    The scanner, diagnostics, metrics recorder and System Details panel all
+    read the same snapshots, so opening the details and then running a scan
+    queries the OS once. Callers that arrive while a snapshot is being taken
+    wait for it instead of taking their own; the two kinds have separate
+    locks, so a slow disk probe never holds up a CPU or memory reading.
+    """
+    def __init__(self, ttl=3.0, probe=None):
+        self.ttl = ttl
+        self.probe = probe or DiskProbe()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._snapshot = None
+        self._disks = None
+
+    def get(self, max_age=None):
+        """A SystemSnapshot no older than `max_age` (default: the TTL) seconds"""
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            if self._snapshot is None or self._snapshot.age() > max_age:
+                self._snapshot = self._take()
+            return self._snapshot
+
+    def get_disks(self, max_age=None):
+        """A DiskSnapshot no older than `max_age` (default: the TTL) seconds"""
+        max_age = self.ttl if max_age is None else max_age
+        with self._disk_lock:
+            if self._disks is None or self._disks.age() > max_age:
+                self._disks = self._probe()
+            return self._disks
+
+    def invalidate(self):
+        """Make the next get() and get_disks() take new snapshots"""
+        with self._lock:
+            self._snapshot = None
+        with self._disk_lock:
+            self._disks = None
+
+    def _take(self):
+        per_core = get_sampler().percent(window=1, percpu=True)
+        return SystemSnapshot(
+            taken_at=time.time(),
+            cpu_percent=round(sum(per_core) / len(per_core), 1) if per_core else 0.0,
+            cpu_per_core=tuple(per_core),
+            memory=psutil.virtual_memory(),
+            swap=psutil.swap_memory(),
+            net_io=psutil.net_io_counters(),
+            boot_time=psutil.boot_time(),
+        )
+
+    def _probe(self):
+        return DiskSnapshot(
+            taken_at=time.time(),
+            mounts=tuple(Mount(record['device'], record['mountpoint'], record['fstype'],
+                               record['status'], record['usage'], record['error'])
+                         for record in self.probe.probe())
+        )
+
+
+_collector = None
+_collector_lock = threading.Lock()
+
+def get_snapshot_collector():
+    """Return the shared SnapshotCollector"""
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = SnapshotCollector()
+        return _collector
+
+def get_snapshot(max_age=None):
+    """The shared collector's current SystemSnapshot"""
+    return get_snapshot_collector().get(max_age)
+
+def get_disk_snapshot(max_age=None):
+    """The shared collector's current DiskSnapshot"""
+    return get_snapshot_collector().get_disks(max_age)
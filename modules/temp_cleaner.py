@@ -0,0 +1,118 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class TempCleaner:
+    """Parallel os.scandir based cleaner for cache and log directories
+
+    Every top-level subdirectory of a root becomes a task for a worker pool
+    and is walked iteratively with os.scandir, reusing the stat results the
+    directory listing already provides. scan() only adds up what could be
+    reclaimed; clean() deletes the files (directories are kept). Both return
+    {root: {'files': n, 'bytes': n, 'errors': n}} and report progress as
+    progress_callback(files, bytes) at most every progress_interval seconds.
+    cancel() stops the workers after the directory each is processing.
+    Directories listed in `exclude` are skipped with everything below them.
+    """
+    def __init__(self, max_workers=8, progress_callback=None, progress_interval=0.2, exclude=()):
+        self.max_workers = max_workers
+        self.exclude = {os.path.normpath(os.path.expanduser(path)) for path in exclude}
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.files_processed = 0
+        self.bytes_processed = 0
+        self._lock = threading.Lock()
+        self._last_report = 0
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop an ongoing scan or clean as soon as possible"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def scan(self, paths):
+        """Report the reclaimable files and bytes under each path (dry run)"""
+        return self._process(paths, delete=False)
+
+    def clean(self, paths):
+        """Delete the files under each path and report what was reclaimed"""
+        return self._process(paths, delete=True)
+
+    def _process(self, paths, delete):
+        self.files_processed = 0
+        self.bytes_processed = 0
+        totals = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='temp-cleaner') as executor:
+            futures = []
+            for path in paths:
+                root = os.path.expanduser(path)
+                totals[path] = {'files': 0, 'bytes': 0, 'errors': 0}
+                if not os.path.isdir(root):
+                    continue
+                # Files directly in the root are handled here, subtrees in the pool
+                subdirs = self._process_directory(root, delete, totals[path])
+                for subdir in subdirs:
+                    futures.append((path, executor.submit(self._walk, subdir, delete)))
+
+            for path, future in futures:
+                result = future.result()
+                for key in ('files', 'bytes', 'errors'):
+                    totals[path][key] += result[key]
+
+        self._report_progress(force=True)
+        return totals
+
+    def _walk(self, top, delete):
+        """Walk one subtree iteratively and return its totals"""
+        totals = {'files': 0, 'bytes': 0, 'errors': 0}
+        stack = [top]
+        while stack and not self._cancelled.is_set():
+            stack.extend(self._process_directory(stack.pop(), delete, totals))
+        return totals
+
+    def _process_directory(self, path, delete, totals):
+        """Size (and delete) the files of one directory, returning its subdirectories"""
+        subdirs = []
+        files = 0
+        size = 0
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if os.path.normpath(entry.path) not in self.exclude:
+                                subdirs.append(entry.path)
+                            continue
+                        entry_size = entry.stat(follow_symlinks=False).st_size
+                        if delete:
+                            os.remove(entry.path)
+                        files += 1
+                        size += entry_size
+                    except OSError:
+                        totals['errors'] += 1
+        except OSError:
+            totals['errors'] += 1
+
+        totals['files'] += files
+        totals['bytes'] += size
+        with self._lock:
+            self.files_processed += files
+            self.bytes_processed += size
+        self._report_progress()
+        return subdirs
+
+    def _report_progress(self, force=False):
+        if not self.progress_callback:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_report < self.progress_interval:
+                return
+            self._last_report = now
+            files, size = self.files_processed, self.bytes_processed
+        self.progress_callback(files, size)
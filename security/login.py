@@ -42,7 +42,7 @@ class LoginWindow(QWidget):
         
         # Error label
         self.error_label = QLabel("")
-        self.error_label.setStyleSheet("color: red;")
+        self.error_label.setObjectName("errorLabel")
         layout.addWidget(self.error_label)
         
         layout.addStretch()
@@ -0,0 +1,58 @@
+import os
+import unittest
+from unittest import mock
+
+from modules.system_profiler import (
+    FIXTURE_ENV, BluetoothDevice, BatteryRecord, HardwareRecord, SystemProfiler
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'system_profiler')
+
+def load_fixture(name):
+    with mock.patch.dict(os.environ, {FIXTURE_ENV: os.path.join(FIXTURES, name)}):
+        return SystemProfiler().load()
+
+class SystemProfilerFixtureTest(unittest.TestCase):
+    def test_apple_silicon(self):
+        profile = load_fixture('apple_silicon.json')
+        self.assertEqual(profile.hardware, HardwareRecord(
+            model_name='MacBook Pro',
+            model_identifier='MacBookPro18,3',
+            processor_name='Apple M1 Pro',
+            processor_speed='',
+            number_of_processors=1,
+            total_cores=8,
+            memory='16 GB',
+            serial_number='C02FX1ABQ6LR',
+            hardware_uuid='5C2E7B1A-93D4-4F1E-8A6C-2B7D90E4F315',
+            activation_lock_status='Disabled'
+        ))
+        self.assertEqual(profile.battery, BatteryRecord(
+            present=True, charge_percent=87, charging=True, fully_charged=False,
+            cycle_count=213, condition='Good', maximum_capacity='91%',
+            charger_connected=True, charger_watts='96'
+        ))
+        bluetooth = profile.bluetooth
+        self.assertEqual((bluetooth.address, bluetooth.state, bluetooth.chipset),
+                         ('F0:2F:4B:10:2A:7C', 'On', 'BCM_4387'))
+        self.assertEqual(bluetooth.devices, (
+            BluetoothDevice('AirPods Pro', '64:B0:A6:3C:19:E2', True, 'Headphones'),
+            BluetoothDevice('Magic Keyboard', 'D0:C0:50:AB:41:07', False, 'Keyboard'),
+            BluetoothDevice('MX Master 3', 'E4:7D:15:02:9A:3B', False, 'Mouse'),
+        ))
+
+    def test_intel(self):
+        profile = load_fixture('intel.json')
+        hardware = profile.hardware
+        self.assertEqual(hardware.processor_name, 'Quad-Core Intel Core i7')
+        self.assertEqual(hardware.processor_speed, '2.3 GHz')
+        self.assertEqual((hardware.number_of_processors, hardware.total_cores), (1, 4))
+        self.assertEqual(hardware.activation_lock_status, 'Enabled')
+        self.assertEqual(profile.battery.condition, 'Service Recommended')
+        self.assertTrue(profile.battery.fully_charged)
+        self.assertFalse(profile.battery.charging)
+        self.assertEqual(profile.bluetooth.state, 'Off')
+        self.assertEqual([device.name for device in profile.bluetooth.devices], ['Magic Mouse'])
+
+if __name__ == '__main__':
+    unittest.main()